@@ -10,13 +10,13 @@ This module provides fast file searching with the following optimizations:
 """
 
 import datetime
+import functools
 import logging
 import os
 import re
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -34,6 +34,20 @@ except ImportError:
         logger.warning("FileIndex not available - running without cache")
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_mtime(timestamp: int) -> str:
+    """Format a whole-second mtime; files sharing a second reuse the string."""
+    return datetime.datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_keyword_alternation(keywords: Tuple[str, ...], case_sensitive: bool) -> re.Pattern:
+    """Build the keyword alternation; repeated searches reuse the compiled pattern."""
+    if not case_sensitive:
+        keywords = tuple(kw.lower() for kw in keywords)
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
 class OptimizedFileSearch:
     """
     Optimized file search with caching and multi-threading.
@@ -52,88 +66,87 @@ class OptimizedFileSearch:
         self.index = FileIndex() if self.use_cache else None
         self.max_workers = max(1, (os.cpu_count() or 4) // 2)
 
-    def _scan_directory(self, directory: str, filename_keywords: List[str],
-                        exclude_keywords: List[str], case_sensitive: bool,
+    @staticmethod
+    def _compile_keywords(keywords: List[str], case_sensitive: bool) -> Optional[re.Pattern]:
+        """Compile keywords into one (memoized) alternation pattern, or None when there are none."""
+        if not keywords:
+            return None
+        return _compile_keyword_alternation(tuple(keywords), case_sensitive)
+
+    def _scan_directory(self, directory: str, keyword_pattern: Optional[re.Pattern],
+                        exclude_pattern: Optional[re.Pattern],
                         filter_by_extension: bool, supported_extensions: Tuple,
                         start_date: Optional[datetime.date],
-                        end_date: Optional[datetime.date]) -> List[Tuple]:
+                        end_date: Optional[datetime.date],
+                        case_sensitive: bool = False) -> List[Tuple]:
         """
         Scan a single directory recursively using os.scandir().
 
+        Patterns are compiled once per search by _compile_keywords() and
+        shared across the whole recursion.
+
         Returns list of (filename, filepath, formatted_time) tuples.
         """
         results = []
 
-        # Pre-compile keyword patterns for faster matching
-        if case_sensitive:
-            keyword_patterns = [re.compile(re.escape(kw)) for kw in filename_keywords]
-            exclude_patterns = [re.compile(re.escape(kw)) for kw in exclude_keywords]
-        else:
-            keyword_patterns = [re.compile(re.escape(kw), re.IGNORECASE) for kw in filename_keywords]
-            exclude_patterns = [re.compile(re.escape(kw), re.IGNORECASE) for kw in exclude_keywords]
+        if keyword_pattern is None:
+            return results
 
         try:
-            for entry in os.scandir(directory):
-                # Check cancellation
-                if self.cancel_event.is_set():
-                    return results
-
-                if entry.is_dir(follow_symlinks=False):
-                    # Check if directory should be excluded
-                    skip_dir = False
-                    for pattern in exclude_patterns:
-                        if pattern.search(entry.name):
-                            skip_dir = True
-                            break
-
-                    if not skip_dir:
-                        # Recurse into subdirectory
-                        sub_results = self._scan_directory(
-                            entry.path, filename_keywords, exclude_keywords,
-                            case_sensitive, filter_by_extension, supported_extensions,
-                            start_date, end_date
-                        )
-                        results.extend(sub_results)
-
-                elif entry.is_file(follow_symlinks=False):
+            # Context manager closes the directory handle even on early return
+            with os.scandir(directory) as entries:
+                for entry in entries:
                     # Check cancellation
                     if self.cancel_event.is_set():
                         return results
 
-                    # Extension filter
-                    if filter_by_extension:
-                        if not entry.name.lower().endswith(supported_extensions):
+                    if entry.is_dir(follow_symlinks=False):
+                        # Check if directory should be excluded
+                        dir_name = entry.name if case_sensitive else entry.name.lower()
+                        if exclude_pattern is None or not exclude_pattern.search(dir_name):
+                            # Recurse into subdirectory
+                            sub_results = self._scan_directory(
+                                entry.path, keyword_pattern, exclude_pattern,
+                                filter_by_extension, supported_extensions,
+                                start_date, end_date, case_sensitive
+                            )
+                            results.extend(sub_results)
+
+                    elif entry.is_file(follow_symlinks=False):
+                        # Check cancellation
+                        if self.cancel_event.is_set():
+                            return results
+
+                        name = entry.name
+                        lower_name = name.lower()  # Once per file, for extension and keyword checks
+
+                        # Extension filter
+                        if filter_by_extension:
+                            if not lower_name.endswith(supported_extensions):
+                                continue
+
+                        # Keyword matching with the pre-compiled alternation
+                        if not keyword_pattern.search(name if case_sensitive else lower_name):
                             continue
 
-                    # Keyword matching with pre-compiled patterns
-                    match_found = False
-                    for pattern in keyword_patterns:
-                        if pattern.search(entry.name):
-                            match_found = True
-                            break
-
-                    if not match_found:
-                        continue
-
-                    # Date range filter - use stat() which is already cached from is_file()
-                    try:
-                        stat = entry.stat(follow_symlinks=False)
-                        mod_timestamp = stat.st_mtime
-                    except (OSError, AttributeError):
-                        continue
-
-                    if start_date or end_date:
-                        mod_date = datetime.date.fromtimestamp(mod_timestamp)
-                        if start_date and mod_date < start_date:
-                            continue
-                        if end_date and mod_date > end_date:
+                        # Date range filter - use stat() which is already cached from is_file()
+                        try:
+                            stat = entry.stat(follow_symlinks=False)
+                            mod_timestamp = stat.st_mtime
+                        except (OSError, AttributeError):
                             continue
 
-                    # Format modified time
-                    mod_time_dt = datetime.datetime.fromtimestamp(mod_timestamp)
-                    formatted_time = mod_time_dt.strftime('%Y-%m-%d %H:%M:%S')
+                        if start_date or end_date:
+                            mod_date = datetime.date.fromtimestamp(mod_timestamp)
+                            if start_date and mod_date < start_date:
+                                continue
+                            if end_date and mod_date > end_date:
+                                continue
+
+                        # Format modified time (cached per second)
+                        formatted_time = _format_mtime(int(mod_timestamp))
 
-                    results.append((entry.name, entry.path, formatted_time))
+                        results.append((entry.name, entry.path, formatted_time))
 
         except (OSError, PermissionError) as e:
             logger.debug(f"Error scanning directory {directory}: {e}")
@@ -172,6 +185,8 @@ class OptimizedFileSearch:
             folder_paths = [folder_paths]
 
         filter_by_extension = supported_extensions is not None and len(supported_extensions) > 0
+        keyword_pattern = self._compile_keywords(filename_keywords, case_sensitive)
+        exclude_pattern = self._compile_keywords(exclude_keywords, case_sensitive)
 
         logger.info(f"Searching in {len(folder_paths)} folder(s)")
         logger.info(f"Keywords: {filename_keywords}, Cache enabled: {self.use_cache}")
@@ -222,9 +237,9 @@ class OptimizedFileSearch:
                         status_callback("Scanning folder...")
 
                     results = self._scan_directory(
-                        folder_path, filename_keywords, exclude_keywords,
-                        case_sensitive, filter_by_extension, supported_extensions,
-                        start_date, end_date
+                        folder_path, keyword_pattern, exclude_pattern,
+                        filter_by_extension, supported_extensions,
+                        start_date, end_date, case_sensitive
                     )
 
                     # Convert to dict format and add status
@@ -233,7 +248,7 @@ class OptimizedFileSearch:
                             "filename": filename,
                             "path": filepath,
                             "modified": formatted_time,
-                            "type": Path(filepath).suffix.lstrip('.').lower() or "unknown"
+                            "type": os.path.splitext(filename)[1][1:].lower() or "unknown"
                         }
                         found_files.append(result_dict)
 
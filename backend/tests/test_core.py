@@ -37,6 +37,18 @@ class TestFileSearch:
         except ImportError:
             pytest.skip('FileSearch not available')
 
+    def test_case_insensitive_keywords_match_lowercased_names(self, temp_dir):
+        try:
+            from backend.core.file_search_optimized import OptimizedFileSearch
+        except ImportError:
+            pytest.skip('FileSearch not available')
+        Path(temp_dir, 'Budget_Report.XLSX').write_text('data')
+        Path(temp_dir, 'notes.txt').write_text('data')
+        fs = OptimizedFileSearch(use_cache=False)
+        results = fs.search_by_filename([temp_dir], ['REPORT'])
+        assert [r['filename'] for r in results] == ['Budget_Report.XLSX']
+        assert fs.search_by_filename([temp_dir], ['REPORT'], case_sensitive=True) == []
+
 class TestExcelProcessor:
     def test_import(self):
         try:
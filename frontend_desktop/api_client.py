@@ -12,6 +12,9 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeout for health checks; a local backend answers well within this
+HEALTH_CHECK_TIMEOUT = (1.0, 2.0)
+
 # MIME type mapping for file uploads (matches backend ALLOWED_UPLOAD_TYPES)
 MIME_TYPES = {
     '.txt': 'text/plain',
@@ -85,7 +88,7 @@ class BackendClient:
         try:
             response = self.session.get(
                 urljoin(self.host, "/health"),
-                timeout=5
+                timeout=HEALTH_CHECK_TIMEOUT
             )
             return response.status_code == 200
         except Exception as e:
@@ -1,5 +1,6 @@
 """File analysis panel component for AI document analysis."""
 
+import os
 import sys
 import time
 import tkinter.filedialog as filedialog
@@ -32,6 +33,7 @@ class EnhancedProgressIndicator(ctk.CTkFrame):
         self.start_time = 0.0
         self.status_message = ""
         self.is_running = False
+        self._last_text = ""
 
         # Create label with Ayesa branding
         self.status_label = ctk.CTkLabel(
@@ -47,6 +49,7 @@ class EnhancedProgressIndicator(ctk.CTkFrame):
         self.is_running = True
         self.start_time = time.time()
         self.status_message = message
+        self._last_text = ""
         self._schedule_update()
 
     def _schedule_update(self):
@@ -54,9 +57,13 @@ class EnhancedProgressIndicator(ctk.CTkFrame):
         if self.is_running:
             elapsed = time.time() - self.start_time
             text = f"{self.status_message}... ({elapsed:.1f}s)"
-            self.status_label.configure(text=text, text_color=COLORS["primary"])
-            # Schedule next update in 100ms
-            self.after(100, self._schedule_update)
+            # Skip the widget redraw when the visible text is unchanged
+            if text != self._last_text:
+                self.status_label.configure(text=text, text_color=COLORS["primary"])
+                self._last_text = text
+            # Tick fast for the first 2s to feel responsive, then back off
+            delay = 100 if elapsed < 2 else 250
+            self.after(delay, self._schedule_update)
 
     def set_status(self, message: str):
         """Update status message while timer is running."""
@@ -66,6 +73,7 @@ class EnhancedProgressIndicator(ctk.CTkFrame):
         """Stop timer and return elapsed time."""
         elapsed = time.time() - self.start_time if self.start_time > 0 else 0
         self.is_running = False
+        self._last_text = ""
 
         if final_message:
             self.status_label.configure(text=final_message, text_color=COLORS["accent"])
@@ -231,8 +239,7 @@ class AnalysisPanel(ctk.CTkFrame):
 
             # Update label with file count
             if len(file_paths) == 1:
-                filename = Path(file_paths[0]).name
-                label_text = filename
+                label_text = os.path.basename(file_paths[0])
             else:
                 label_text = f"{len(file_paths)} files selected"
 
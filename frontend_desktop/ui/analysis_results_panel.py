@@ -1,6 +1,10 @@
 """Specialized results panel for AI analysis output (text-only)."""
 
+import os
+import subprocess
 import sys
+import tempfile
+import time
 import tkinter as tk
 from pathlib import Path
 from typing import Callable, Optional
@@ -10,12 +14,20 @@ import customtkinter as ctk
 # Handle branding imports with fallback
 try:
     from ..branding import COLORS, FONTS
+    from .clipboard import set_clipboard
 except ImportError:
     parent_dir = str(Path(__file__).parent.parent)
     if parent_dir not in sys.path:
         sys.path.insert(0, parent_dir)
     from branding import COLORS, FONTS
 
+    from ui.clipboard import set_clipboard
+
+STREAM_CHUNK_SIZE = 64 * 1024  # Characters inserted per event-loop turn
+TITLE_UPDATE_INTERVAL = 0.016  # Seconds between line-count title refreshes while streaming
+DISPLAY_LIMIT = 256 * 1024  # Results longer than this are shown as head + tail
+DISPLAY_EDGE = 128 * 1024  # Characters kept from each end of a truncated result
+
 
 class AnalysisResultsPanel(ctk.CTkFrame):
     """Large text area for displaying AI analysis results."""
@@ -23,48 +35,32 @@ class AnalysisResultsPanel(ctk.CTkFrame):
     def __init__(self, parent, on_status_callback: Optional[Callable] = None):
         super().__init__(parent, fg_color=COLORS["background"])
         self.on_status = on_status_callback or (lambda x: None)
+        self._stream_after_id: Optional[str] = None  # Pending chunk of a streamed insert
+        self._line_count: int = 0  # Lines inserted so far (or the caller-supplied total)
+        self._count_lines: bool = True  # False when the caller already knows the line count
+        self._last_title_update: float = 0.0
+        self._full_result: str = ""  # Untruncated text of the current result
+        self._export_path: Optional[str] = None  # Temp file holding _full_result, written on first export
+        self.export_button: Optional[ctk.CTkButton] = None
 
         self._build_ui()
 
     def _build_ui(self):
         """Build analysis results panel with large text area."""
         # Header frame
-        header_frame = ctk.CTkFrame(self, fg_color="transparent")
-        header_frame.pack(fill="x", padx=15, pady=(15, 10))
+        self.header_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.header_frame.pack(fill="x", padx=15, pady=(15, 10))
 
         self.title_label = ctk.CTkLabel(
-            header_frame,
+            self.header_frame,
             text="Analysis Results",
             font=FONTS["heading"],
             text_color=COLORS["primary"]
         )
         self.title_label.pack(side="left")
 
-        # Copy button
-        ctk.CTkButton(
-            header_frame,
-            text="📋 Copy Results",
-            width=100,
-            height=28,
-            font=FONTS["small"],
-            fg_color=COLORS["primary"],
-            text_color=COLORS["background"],
-            hover_color="#0000A8",
-            command=self._copy_results
-        ).pack(side="right", padx=(10, 0))
-
-        # Clear button
-        ctk.CTkButton(
-            header_frame,
-            text="✕ Clear",
-            width=80,
-            height=28,
-            font=FONTS["small"],
-            fg_color=COLORS["accent"],
-            text_color=COLORS["background"],
-            hover_color="#E01670",
-            command=self._clear_results
-        ).pack(side="right")
+        # Copy/Clear buttons are secondary; build them once the panel has painted
+        self.after_idle(self._build_header_buttons)
 
         # Large text area for analysis output
         text_frame = ctk.CTkFrame(self, fg_color=COLORS["surface"], border_width=1, border_color=COLORS["border"])
@@ -93,25 +89,155 @@ class AnalysisResultsPanel(ctk.CTkFrame):
         scrollbar.pack(side="right", fill="y")
         self.text_widget.config(yscrollcommand=scrollbar.set)
 
-    def display_analysis_result(self, result: str):
-        """Display AI analysis result in large text area."""
+    def _build_header_buttons(self):
+        """Create the Copy/Clear header buttons (deferred from _build_ui)."""
+        # Copy button
+        ctk.CTkButton(
+            self.header_frame,
+            text="📋 Copy Results",
+            width=100,
+            height=28,
+            font=FONTS["small"],
+            fg_color=COLORS["primary"],
+            text_color=COLORS["background"],
+            hover_color="#0000A8",
+            command=self._copy_results
+        ).pack(side="right", padx=(10, 0))
+
+        # Clear button
+        ctk.CTkButton(
+            self.header_frame,
+            text="✕ Clear",
+            width=80,
+            height=28,
+            font=FONTS["small"],
+            fg_color=COLORS["accent"],
+            text_color=COLORS["background"],
+            hover_color="#E01670",
+            command=self._clear_results
+        ).pack(side="right")
+
+        # Export button, only shown while the displayed result is truncated
+        self.export_button = ctk.CTkButton(
+            self.header_frame,
+            text="Export full result",
+            width=120,
+            height=28,
+            font=FONTS["small"],
+            fg_color=COLORS["primary"],
+            text_color=COLORS["background"],
+            hover_color="#0000A8",
+            command=self._export_full_result
+        )
+        self._update_export_button()
+
+    def _update_export_button(self):
+        """Show the export button only when the text area holds a truncated result."""
+        if self.export_button is None:
+            return
+        if len(self._full_result) > DISPLAY_LIMIT:
+            self.export_button.pack(side="right", padx=(0, 10))
+        else:
+            self.export_button.pack_forget()
+
+    def display_analysis_result(self, result: str, line_count: Optional[int] = None):
+        """
+        Display AI analysis result in large text area.
+
+        Args:
+            result: Analysis result text
+            line_count: Line count of result, if already known (skips counting)
+        """
+        self._cancel_stream()
         self.text_widget.config(state="normal")
         self.text_widget.delete("1.0", "end")
-        self.text_widget.insert("1.0", result)
         self.text_widget.config(state="disabled")
 
-        # Update title with line count
-        line_count = result.count("\n") + 1
-        self.title_label.configure(text=f"Analysis Results ({line_count} lines)")
+        self._count_lines = line_count is None
+        self._line_count = 1 if line_count is None else line_count
+        self._last_title_update = 0.0
+        if not self._count_lines:
+            self.title_label.configure(text=f"Analysis Results ({line_count} lines)")
+
+        # Keep Tk layout cost bounded: huge results show only their head and tail
+        self._discard_export_file()
+        self._full_result = result
+        if len(result) > DISPLAY_LIMIT:
+            omitted = len(result) - 2 * DISPLAY_EDGE
+            result = (
+                result[:DISPLAY_EDGE]
+                + f"\n\n... [truncated {omitted:,} characters, use Export full result] ...\n\n"
+                + result[-DISPLAY_EDGE:]
+            )
+        self._update_export_button()
+        self._stream_insert(result)
+
+    def _stream_insert(self, text: str, chunk: int = STREAM_CHUNK_SIZE, offset: int = 0):
+        """Insert one chunk of text, then yield to the event loop before the next."""
+        piece = text[offset:offset + chunk]
+        self.text_widget.config(state="normal")
+        self.text_widget.insert("end-1c", piece)
+        self.text_widget.config(state="disabled")
+
+        offset += chunk
+        done = offset >= len(text)
+
+        # Update title with line count, throttled while content streams in
+        now = time.monotonic()
+        if self._count_lines:
+            self._line_count += piece.count("\n")
+        if self._count_lines and (done or now - self._last_title_update >= TITLE_UPDATE_INTERVAL):
+            self.title_label.configure(text=f"Analysis Results ({self._line_count} lines)")
+            self._last_title_update = now
+
+        if done:
+            self._stream_after_id = None
+        else:
+            self._stream_after_id = self.text_widget.after_idle(self._stream_insert, text, chunk, offset)
+
+    def _cancel_stream(self):
+        """Stop a streamed insert that is still in progress."""
+        if self._stream_after_id is not None:
+            self.text_widget.after_cancel(self._stream_after_id)
+            self._stream_after_id = None
+
+    def _export_full_result(self):
+        """Write the untruncated result to a temp file and open it."""
+        if not self._full_result:
+            self.on_status("No results to export")
+            return
+        try:
+            # Write once per result; later clicks reopen the same file
+            if self._export_path is None:
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", suffix=".txt", prefix="analysis_", delete=False
+                ) as f:
+                    f.write(self._full_result)
+                self._export_path = f.name
+            if os.name == "nt":  # Windows
+                os.startfile(self._export_path)
+            elif os.name == "posix":  # macOS/Linux
+                subprocess.Popen(["open" if sys.platform == "darwin" else "xdg-open", self._export_path])
+            self.on_status(f"Full result exported to {self._export_path}")
+        except Exception as e:
+            self.on_status(f"Export error: {e}")
+
+    def _discard_export_file(self):
+        """Delete the temp file exported for the previous result, if any."""
+        if self._export_path is None:
+            return
+        try:
+            os.remove(self._export_path)
+        except OSError:
+            pass  # Still open in a viewer, or already gone
+        self._export_path = None
 
     def _copy_results(self):
         """Copy all results to clipboard."""
         try:
-            text = self.text_widget.get("1.0", "end-1c")
+            text = self._full_result or self.text_widget.get("1.0", "end-1c")
             if text:
-                self.text_widget.clipboard_clear()
-                self.text_widget.clipboard_append(text)
-                self.text_widget.update()
+                set_clipboard(self.text_widget, text)
                 self.on_status("Analysis results copied to clipboard")
             else:
                 self.on_status("No results to copy")
@@ -120,12 +246,21 @@ class AnalysisResultsPanel(ctk.CTkFrame):
 
     def _clear_results(self):
         """Clear all results."""
+        self._cancel_stream()
         self.text_widget.config(state="normal")
         self.text_widget.delete("1.0", "end")
         self.text_widget.config(state="disabled")
+        self._discard_export_file()
+        self._full_result = ""
+        self._update_export_button()
         self.title_label.configure(text="Analysis Results")
         self.on_status("Results cleared")
 
     def clear_results(self):
         """Public method to clear results."""
         self._clear_results()
+
+    def destroy(self):
+        """Remove the exported temp file along with the panel."""
+        self._discard_export_file()
+        super().destroy()
@@ -0,0 +1,102 @@
+"""Clipboard helper with a native fast path for large text."""
+
+import shutil
+import subprocess
+import sys
+
+# Text at least this long bypasses Tk's clipboard when a native route exists
+NATIVE_CLIPBOARD_MIN_CHARS = 64 * 1024
+
+
+def set_clipboard(widget, text: str):
+    """
+    Replace the clipboard contents with text.
+
+    Large text goes straight to the OS clipboard (Win32 API, pbcopy,
+    wl-copy, xclip or xsel) instead of through Tcl's string handling.
+    Small text, and any platform without a native route, uses Tk.
+
+    Args:
+        widget: Any Tk widget (used for the Tk fallback)
+        text: Text to copy
+    """
+    if len(text) >= NATIVE_CLIPBOARD_MIN_CHARS and _set_native_clipboard(widget, text):
+        return
+    widget.clipboard_clear()
+    widget.clipboard_append(text)
+    widget.update()  # Required for clipboard to work
+
+
+def _set_native_clipboard(widget, text: str) -> bool:
+    """Copy text with the platform clipboard; return False if unavailable."""
+    if sys.platform == "win32":
+        return _set_windows_clipboard(widget, text)
+
+    data = text.encode("utf-8")
+    for command in _clipboard_commands():
+        try:
+            subprocess.run(command, input=data, check=True, timeout=5)
+            return True
+        except (OSError, subprocess.SubprocessError):
+            continue
+    return False
+
+
+def _clipboard_commands():
+    """Clipboard writer commands available on this machine, preferred first."""
+    if sys.platform == "darwin":
+        candidates = [["pbcopy"]]
+    else:
+        candidates = [
+            ["wl-copy"],
+            ["xclip", "-selection", "clipboard"],
+            ["xsel", "--clipboard", "--input"],
+        ]
+    return [command for command in candidates if shutil.which(command[0])]
+
+
+def _set_windows_clipboard(widget, text: str) -> bool:
+    """Copy text with the Win32 clipboard API (CF_UNICODETEXT), owned by the widget's window."""
+    import ctypes
+    from ctypes import wintypes
+
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    user32.OpenClipboard.argtypes = (wintypes.HWND,)
+    user32.SetClipboardData.argtypes = (wintypes.UINT, wintypes.HANDLE)
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    kernel32.GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalFree.argtypes = (wintypes.HGLOBAL,)
+
+    # CF_UNICODETEXT expects CRLF line endings, as Tk writes them
+    text = text.replace("\r\n", "\n").replace("\n", "\r\n")
+    data = text.encode("utf-16-le") + b"\0\0"
+    # EmptyClipboard() hands ownership to the opening window; with a NULL owner SetClipboardData fails
+    hwnd = int(widget.winfo_toplevel().wm_frame(), 16)
+    if not user32.OpenClipboard(hwnd):
+        return False
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not handle:
+            return False
+        pointer = kernel32.GlobalLock(handle)
+        if not pointer:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(pointer, data, len(data))
+        kernel32.GlobalUnlock(handle)
+        # On success the clipboard owns the memory
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)
+            return False
+        return True
+    finally:
+        user32.CloseClipboard()
@@ -1,17 +1,25 @@
 """Interactive results table with right-click context menu and file operations."""
 
+import math
 import os
 import subprocess
 import sys
 import tkinter as tk
+from array import array
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 
 # Handle branding imports with fallback
 try:
     from ..branding import COLORS
+    from .clipboard import set_clipboard
+    from .stat_cache import StatCache
 except ImportError:
     # Fallback: add parent directory to path
     parent_dir = str(Path(__file__).parent.parent)
@@ -19,6 +27,58 @@ except ImportError:
         sys.path.insert(0, parent_dir)
     from branding import COLORS
 
+    from ui.clipboard import set_clipboard
+    from ui.stat_cache import StatCache
+
+
+# Fixed row geometry for the virtualized renderer (canvas pixels)
+ROW_HEIGHT = 48
+ROW_PAD = 2
+ROW_H = ROW_HEIGHT + 2 * ROW_PAD
+
+# Columns the table can be sorted by (order of the normalized row tuples)
+SORT_COLUMNS = ("filename", "path", "modified", "type")
+
+# Quick filter waits this long after the last keystroke before rescanning
+FILTER_DEBOUNCE_MS = 150
+
+# Result count above which the quick filter builds a trigram index
+TRIGRAM_INDEX_MIN_RESULTS = 2000
+
+# Result count from which column sorts use NumPy's argsort (when available)
+NUMPY_SORT_MIN_RESULTS = 5000
+
+# File stats are trusted for this many seconds before hitting the disk again
+STAT_CACHE_TTL = 30.0
+
+
+class ResultRow:
+    """Compact search result with lowercase copies of the searchable fields."""
+
+    __slots__ = ("filename", "path", "modified", "type", "filename_lower", "path_lower")
+
+    def __init__(self, filename: str, path: str, modified: str, type_: str):
+        self.filename = filename
+        self.path = path
+        self.modified = modified
+        self.type = type_
+        self.filename_lower = filename.lower()
+        self.path_lower = path.lower()
+
+    @classmethod
+    def from_dict(cls, result: Dict[str, Any]) -> "ResultRow":
+        """Build a row from a backend result dict."""
+        return cls(
+            result.get("filename") or "",
+            result.get("path") or "",
+            result.get("modified") or "",
+            result.get("type") or "file",
+        )
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return the row as a result dict."""
+        return {"filename": self.filename, "path": self.path, "modified": self.modified, "type": self.type}
+
 
 class InteractiveResultsPanel(ctk.CTkFrame):
     """Interactive results table with file operations (copy, open, etc)."""
@@ -26,15 +86,38 @@ class InteractiveResultsPanel(ctk.CTkFrame):
     def __init__(self, parent, on_status_callback: Optional[Callable] = None):
         super().__init__(parent, fg_color=COLORS["background"])
         self.on_status = on_status_callback or (lambda x: None)
-        self.results: List[Dict[str, Any]] = []
-        self.filtered_results: List[Dict[str, Any]] = []  # Results after quick filter
+        self.results: List[ResultRow] = []
         self.selected_row: Optional[int] = None
         self.sort_column: str = "filename"  # Default sort column
         self.sort_ascending: bool = True   # Sort direction
         self.quick_filter_text: str = ""  # Current quick filter text
+        self._view: List[int] = []  # Sorted + filtered result indices backing the viewport
+        self._last_total_h: Optional[int] = None  # Row scroll height last given to the canvas
+        self._row_pool: List[tk.Frame] = []  # Reusable row widgets (~visible rows)
+        self._normalized_rows: List[Tuple[str, str, str, str]] = []  # Lowercased SORT_COLUMNS values
+        self._sort_keys: Dict[str, List[Any]] = {}  # Per-column key lists, extracted on first sort
+        self._sorted_perm: Dict[Tuple[str, bool], List[int]] = {}  # Cached sort permutations
+        self._haystacks: List[str] = []  # Lowercased "filename\0path" per result for the quick filter
+        self._filter_after_id: Optional[str] = None  # Pending debounced filter callback
+        self._last_needle: str = ""  # Needle behind _last_filtered_idx
+        self._last_filtered_idx: Optional[List[int]] = None  # Previous matches, in current sort order
+        self._trigram_index: Optional[Dict[str, array]] = None  # Trigram -> ascending result indices
+        self._sorted_rank: Dict[Tuple[str, bool], List[int]] = {}  # Inverse of each cached permutation
+        # Display strings per result (filename, truncated path, date, type), formatted at ingest
+        self._display_cols: Tuple[List[str], List[str], List[str], List[str]] = ([], [], [], [])
+        self._analysis_lines: Tuple[Optional[str], int] = (None, 0)  # Last analysis text and its line count
+        self._row_tag = f"ResultRow{id(self)}"  # Bindtag shared by every pooled row widget
+        self._stat_cache = StatCache(STAT_CACHE_TTL)
+        # Stats files for open, the context menu and properties off the UI thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="results-io")
 
         self._build_ui()
 
+    @property
+    def filtered_results(self) -> List[ResultRow]:
+        """Results after sort and quick filter (materialized only on request)."""
+        return [self.results[i] for i in self._view]
+
     def _build_ui(self):
         """Build interactive results panel layout with Ayesa branding."""
         # Header frame
@@ -182,12 +265,22 @@ class InteractiveResultsPanel(ctk.CTkFrame):
             yscrollcommand=scrollbar.set
         )
         self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.configure(command=self.canvas.yview)
+        scrollbar.configure(command=self._on_scroll)
 
-        # Inner frame for results
+        # Inner frame for messages (empty state, analysis text); result rows
+        # are pooled canvas windows managed by _render_viewport()
         self.inner_frame = ctk.CTkFrame(self.canvas, fg_color=COLORS["surface"])
         self.canvas_window = self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
 
+        # Message widgets are created once and reconfigured in place
+        self._message_label = ctk.CTkLabel(
+            self.inner_frame,
+            text="",
+            font=("Arial", 11),
+            text_color=COLORS["text_secondary"]
+        )
+        self._analysis_text: Optional[tk.Text] = None  # Created on first analysis result
+
         # Bind mousewheel for scrolling
         self.canvas.bind("<MouseWheel>", self._on_mousewheel)
         self.canvas.bind("<Button-4>", self._on_mousewheel)
@@ -196,9 +289,71 @@ class InteractiveResultsPanel(ctk.CTkFrame):
         # Bind canvas resize to update inner frame width
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
+        # Message content sizes the scroll region from its own geometry events
+        self.inner_frame.bind("<Configure>", self._on_message_configure)
+
+        # Row events are bound once on a shared bindtag and hit-tested to a row
+        self.bind_class(self._row_tag, "<Button-1>", self._dispatch_click)
+        self.bind_class(self._row_tag, "<Button-3>", self._dispatch_context_menu)
+        self.bind_class(self._row_tag, "<Double-Button-1>", self._dispatch_double_click)
+        self.bind_class(self._row_tag, "<Enter>", self._dispatch_enter)
+        self.bind_class(self._row_tag, "<Leave>", self._dispatch_leave)
+
+        self._build_context_menu()
+
+    def _build_context_menu(self):
+        """Build the row context menu once; its commands act on _menu_row."""
+        self._menu_row: Optional[ResultRow] = None
+
+        # Create context menu with Ayesa branding
+        self._context_menu = tk.Menu(
+            self.canvas,
+            tearoff=False,
+            bg=COLORS["surface"],
+            fg=COLORS["text_primary"],
+            activebackground=COLORS["primary"],
+            activeforeground=COLORS["background"]
+        )
+
+        self._context_menu.add_command(
+            label="📋 Copy Full Path",
+            command=lambda: self._copy_to_clipboard(self._menu_row.path)
+        )
+        self._context_menu.add_command(
+            label="📄 Copy Filename",
+            command=lambda: self._copy_to_clipboard(self._menu_row.filename)
+        )
+        self._context_menu.add_separator()
+        self._context_menu.add_command(
+            label="📂 Open File Location",
+            command=lambda: self._open_folder(self._menu_row.path)
+        )
+        self._context_menu.add_command(
+            label="▶️ Open File",
+            command=lambda: self._open_file(self._menu_row.path)
+        )
+        self._context_menu.add_separator()
+        self._context_menu.add_command(
+            label="ℹ️ File Properties",
+            command=lambda: self._show_file_info(self._menu_row.path)
+        )
+
     def _on_canvas_configure(self, event):
         """Update inner frame width when canvas resizes."""
         self.canvas.itemconfig(self.canvas_window, width=event.width)
+        if self._view:
+            self._render_viewport()
+
+    def _on_message_configure(self, event):
+        """Track the message frame's size while no result rows are shown."""
+        if not self._view:
+            self._last_total_h = None
+            self.canvas.configure(scrollregion=(0, 0, event.width, event.height))
+
+    def _on_scroll(self, *args):
+        """Scrollbar command: move the view, then reseat visible rows."""
+        self.canvas.yview(*args)
+        self._render_viewport()
 
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
@@ -206,67 +361,265 @@ class InteractiveResultsPanel(ctk.CTkFrame):
             self.canvas.yview_scroll(1, "units")
         elif event.num == 4 or event.delta > 0:
             self.canvas.yview_scroll(-1, "units")
+        self._render_viewport()
+
+    def _set_scrollregion(self):
+        """Size the scroll region for the full view without realizing rows."""
+        total_h = len(self._view) * ROW_H
+        if total_h != self._last_total_h:
+            self.canvas.configure(scrollregion=(0, 0, 0, total_h))
+            self._last_total_h = total_h
+
+    def _show_message_frame(self, visible: bool):
+        """Show the message frame, or park it above the scroll region."""
+        self.canvas.coords(self.canvas_window, 0, 0 if visible else -10000)
+
+    def _show_rows(self, rows: List[int]):
+        """Display result indices through the virtualized pool, starting at the top."""
+        self._clear_messages()
+        self._show_message_frame(False)
+
+        self._view = rows
+        self.selected_row = None
+        for row_frame in self._row_pool:
+            row_frame.index = None  # Force a rebind on next render
+        self._set_scrollregion()
+        self.canvas.yview_moveto(0)
+        self._render_viewport()
+
+    def _clear_messages(self):
+        """Unpack the message widgets without destroying them."""
+        self._message_label.pack_forget()
+        if self._analysis_text is not None:
+            self._analysis_text.pack_forget()
+
+    def _show_message(self, text: str):
+        """Show a one-line message (e.g. empty state) in place of the rows."""
+        self._hide_rows()
+        self._clear_messages()
+        self._message_label.configure(text=text)
+        self._message_label.pack(padx=10, pady=20)
+
+    def _hide_rows(self):
+        """Drop the current view and park all pooled rows."""
+        self._view = []
+        for row_frame in self._row_pool:
+            self.canvas.coords(row_frame.item, ROW_PAD, -ROW_H)
+        self._show_message_frame(True)
+        self._last_total_h = None
+        self.canvas.configure(
+            scrollregion=(0, 0, self.inner_frame.winfo_width(), self.inner_frame.winfo_height())
+        )
+
+    def _render_viewport(self):
+        """Reseat pooled rows onto the slice of the view currently visible."""
+        if not self._view:
+            return
+
+        visible = math.ceil(max(self.canvas.winfo_height(), ROW_H) / ROW_H) + 1
+        first = max(0, int(self.canvas.canvasy(0) // ROW_H))
+        width = max(self.canvas.winfo_width() - 2 * ROW_PAD, 1)
+
+        while len(self._row_pool) < visible:
+            self._row_pool.append(self._create_result_row())
+
+        for i, row_frame in enumerate(self._row_pool):
+            position = first + i
+            if i < visible and position < len(self._view):
+                self.canvas.coords(row_frame.item, ROW_PAD, position * ROW_H + ROW_PAD)
+                self.canvas.itemconfig(row_frame.item, width=width)
+                self._bind_row_data(row_frame, position)
+            else:
+                # Park unused rows above the scroll region
+                self.canvas.coords(row_frame.item, ROW_PAD, -ROW_H)
 
     def _on_quick_filter_change(self, event=None):
-        """Handle quick filter text entry changes."""
+        """Handle quick filter text entry changes (debounced)."""
+        self._cancel_pending_filter()
+        self._filter_after_id = self.after(FILTER_DEBOUNCE_MS, self._apply_quick_filter)
+
+    def _cancel_pending_filter(self):
+        """Drop a scheduled filter pass, if any."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
+    def _apply_quick_filter(self):
+        """Apply the quick filter once typing has paused."""
+        self._filter_after_id = None
         self.quick_filter_text = self.quick_filter_entry.get().strip().lower()
 
-        # Filter results based on quick filter text
-        if self.quick_filter_text:
-            self.filtered_results = [
-                r for r in self.results
-                if self.quick_filter_text in r.get("filename", "").lower()
-                   or self.quick_filter_text in r.get("path", "").lower()
-            ]
-        else:
-            self.filtered_results = self.results
-
         # Re-display with filtered results
         if self.results:
             self._refresh_display()
 
     def _clear_quick_filter(self):
         """Clear the quick filter."""
+        self._cancel_pending_filter()
         self.quick_filter_entry.delete(0, "end")
         self.quick_filter_text = ""
-        self.filtered_results = self.results
 
         if self.results:
             self._refresh_display()
 
         self.on_status("Filter cleared")
 
-    def _refresh_display(self):
-        """Refresh the results display with current filtered results."""
-        # Sort filtered results based on current sort column
-        sorted_results = sorted(
-            self.filtered_results,
-            key=lambda x: x.get(self.sort_column, "").lower() if isinstance(x.get(self.sort_column), str) else x.get(self.sort_column, 0),
-            reverse=not self.sort_ascending
+    def _index_results(self, results: List[ResultRow]):
+        """Precompute per-column sort keys and filter haystacks; drop cached permutations."""
+        # Every key is lowercased here, once; sorting and filtering never call lower()
+        self._normalized_rows = [
+            (r.filename_lower, r.path_lower, r.modified.lower(), r.type.lower())
+            for r in results
+        ]
+        self._sort_keys = {}
+        self._sorted_perm = {}
+        self._sorted_rank = {}
+        self._trigram_index = None  # Rebuilt lazily by the first long-enough filter
+        self._reset_incremental_filter()
+        # NUL separator keeps a needle from matching across filename/path
+        self._haystacks = [r.filename_lower + "\0" + r.path_lower for r in results]
+        self._display_cols = self._format_display_columns(results)
+
+    @staticmethod
+    def _format_display_columns(results: List[ResultRow]) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """Format row label text once per result set so rendering only reads it."""
+        return (
+            [r.filename or "Unknown" for r in results],
+            [r.path if len(r.path) < 40 else "..." + r.path[-37:] for r in results],
+            [r.modified[:10] for r in results],
+            [r.type[:6] for r in results],
         )
 
-        # Clear previous results
-        for widget in self.inner_frame.winfo_children():
-            widget.destroy()
+    def _reset_incremental_filter(self):
+        """Forget previous matches so the next filter scans the full permutation."""
+        self._last_needle = ""
+        self._last_filtered_idx = None
+
+    def _sorted_indices(self) -> List[int]:
+        """Return the result permutation for the current sort, computing it once."""
+        cache_key = (self.sort_column, self.sort_ascending)
+        perm = self._sorted_perm.get(cache_key)
+        if perm is None:
+            keys = self._sort_keys.get(self.sort_column)
+            if keys is None:
+                column_getter = itemgetter(SORT_COLUMNS.index(self.sort_column))
+                keys = list(map(column_getter, self._normalized_rows))
+                self._sort_keys[self.sort_column] = keys
+            perm = None
+            if len(keys) >= NUMPY_SORT_MIN_RESULTS:
+                perm = self._argsort(keys, self.sort_ascending)
+            if perm is None:
+                perm = sorted(range(len(self.results)), key=keys.__getitem__, reverse=not self.sort_ascending)
+            self._sorted_perm[cache_key] = perm
+        return perm
+
+    @staticmethod
+    def _argsort(keys: List[Any], ascending: bool) -> Optional[List[int]]:
+        """
+        Stable argsort of a key column in C, matching sorted()'s tie order.
 
-        if not sorted_results:
-            empty_label = ctk.CTkLabel(
-                self.inner_frame,
-                text="No files match filter.",
-                font=("Arial", 11),
-                text_color=COLORS["text_secondary"]
-            )
-            empty_label.pack(padx=10, pady=20)
-            self.count_label.configure(text=f"{len(self.filtered_results)}/{len(self.results)} files")
+        Returns None when NumPy is not installed or the column is not all
+        strings (mixed or missing values), leaving those to the Python sort.
+        """
+        try:
+            import numpy as np  # Optional; imported on the first large sort only
+        except ImportError:
+            return None
+        column = np.array(keys)
+        if column.dtype.kind != "U":
+            return None
+        if ascending:
+            return np.argsort(column, kind="stable").tolist()
+        # Sort the reversed column and flip back, so ties keep result order
+        n = len(keys)
+        return (n - 1 - np.argsort(column[::-1], kind="stable")[::-1]).tolist()
+
+    def _sorted_ranks(self) -> List[int]:
+        """Return each result's position in the current sort permutation."""
+        cache_key = (self.sort_column, self.sort_ascending)
+        rank = self._sorted_rank.get(cache_key)
+        if rank is None:
+            rank = [0] * len(self.results)
+            for position, i in enumerate(self._sorted_indices()):
+                rank[i] = position
+            self._sorted_rank[cache_key] = rank
+        return rank
+
+    def _build_trigram_index(self):
+        """Build an inverted index from each haystack trigram to result indices."""
+        index: Dict[str, array] = defaultdict(lambda: array("i"))
+        for i, haystack in enumerate(self._haystacks):
+            for gram in {haystack[j:j + 3] for j in range(len(haystack) - 2)}:
+                index[gram].append(i)
+        self._trigram_index = dict(index)
+
+    def _trigram_candidates(self, needle: str) -> Optional[List[int]]:
+        """
+        Narrow candidates by intersecting the needle's trigram postings.
+
+        Returns candidates in current sort order (still to be verified with
+        a substring test), or None when the index does not apply.
+        """
+        if len(needle) < 3 or len(self.results) <= TRIGRAM_INDEX_MIN_RESULTS:
+            return None
+        if self._trigram_index is None:
+            self._build_trigram_index()
+
+        postings = []
+        for gram in {needle[j:j + 3] for j in range(len(needle) - 2)}:
+            posting = self._trigram_index.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+
+        # Intersect smallest-first so the working set shrinks fastest
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            matches.intersection_update(posting)
+            if not matches:
+                return []
+
+        return sorted(matches, key=self._sorted_ranks().__getitem__)
+
+    def _current_indices(self) -> List[int]:
+        """Walk the cached sort permutation once, keeping rows that pass the filter."""
+        perm = self._sorted_indices()
+        needle = self.quick_filter_text
+        if not needle:
+            self._reset_incremental_filter()
+            return perm
+
+        # A needle containing the previous one (e.g. "repo" -> "repor") can
+        # only narrow its matches, so rescan those instead of every result
+        if self._last_filtered_idx is not None and self._last_needle in needle:
+            candidates = self._last_filtered_idx
+        else:
+            candidates = self._trigram_candidates(needle)
+            if candidates is None:
+                candidates = perm
+
+        haystacks = self._haystacks
+        indices = [i for i in candidates if needle in haystacks[i]]
+        self._last_needle = needle
+        self._last_filtered_idx = indices
+        return indices
+
+    def _refresh_display(self):
+        """Refresh the results display with current filtered results."""
+        # Sorted + filtered view from the cached permutation (no re-sort)
+        indices = self._current_indices()
+        if not indices:
+            self._show_message("No files match filter.")
+            self.count_label.configure(text=f"0/{len(self.results)} files")
             return
 
-        # Add result rows
-        for i, file_info in enumerate(sorted_results):
-            self._create_result_row(i, file_info)
+        # Render only the visible window of rows
+        self._show_rows(indices)
 
         # Update counts
         if self.quick_filter_text:
-            self.count_label.configure(text=f"{len(self.filtered_results)}/{len(self.results)} files")
+            self.count_label.configure(text=f"{len(indices)}/{len(self.results)} files")
         else:
             self.count_label.configure(text=f"{len(self.results)} files")
 
@@ -277,10 +630,6 @@ class InteractiveResultsPanel(ctk.CTkFrame):
             else:
                 self.cache_label.configure(text="🔍 Live search")
 
-        # Update canvas scroll region
-        self.inner_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
     def _sort_results(self, column: str):
         """Sort results by clicking column header."""
         # Toggle sort direction if same column
@@ -290,6 +639,9 @@ class InteractiveResultsPanel(ctk.CTkFrame):
             self.sort_column = column
             self.sort_ascending = True
 
+        # Previous matches are ordered by the old sort
+        self._reset_incremental_filter()
+
         # Update header indicators
         for col, header in self.headers.items():
             if col == column:
@@ -310,40 +662,29 @@ class InteractiveResultsPanel(ctk.CTkFrame):
             results: List of file result dicts
             is_cached: Whether these results came from cache
         """
+        results = [ResultRow.from_dict(r) for r in results]
         self.results = results
-        self.filtered_results = results  # Initialize filtered_results with all results
         self._is_cached = is_cached
+        self._index_results(results)
 
         # Clear quick filter when new results are displayed
+        self._cancel_pending_filter()
         self.quick_filter_entry.delete(0, "end")
         self.quick_filter_text = ""
 
-        # Sort results based on current sort column
-        sorted_results = sorted(
-            results,
-            key=lambda x: x.get(self.sort_column, "").lower() if isinstance(x.get(self.sort_column), str) else x.get(self.sort_column, 0),
-            reverse=not self.sort_ascending
-        )
-
-        # Clear previous results
-        for widget in self.inner_frame.winfo_children():
-            widget.destroy()
-
-        if not sorted_results:
-            empty_label = ctk.CTkLabel(
-                self.inner_frame,
-                text="No files found.",
-                font=("Arial", 11),
-                text_color=COLORS["text_secondary"]
-            )
-            empty_label.pack(padx=10, pady=20)
+        # Sort results based on current sort column (cached permutation)
+        indices = self._sorted_indices()
+        if not indices:
+            self._show_message("No files found.")
             self.count_label.configure(text="0 files")
             self.cache_label.configure(text="")
             return
 
-        # Add result rows (use sorted results)
-        for i, file_info in enumerate(sorted_results):
-            self._create_result_row(i, file_info)
+        # Render only the visible window of rows
+        self._show_rows(indices)
+
+        # New results invalidate cached stats
+        self._stat_cache.clear()
 
         # Update counts
         self.count_label.configure(text=f"{len(results)} files")
@@ -353,102 +694,170 @@ class InteractiveResultsPanel(ctk.CTkFrame):
         else:
             self.cache_label.configure(text="🔍 Live search")
 
-        # Update canvas scroll region
-        self.inner_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def _create_result_row(self) -> tk.Frame:
+        """
+        Create a pooled result row; data is bound later by _bind_row_data().
 
-    def _create_result_row(self, index: int, file_info: Dict[str, Any]):
-        """Create an interactive result row."""
-        row_frame = ctk.CTkFrame(self.inner_frame, fg_color=COLORS["background"], height=48)
-        row_frame.pack(fill="x", padx=2, pady=2)
+        Rows only show static text, so they use plain tk widgets instead of
+        customtkinter ones (no per-widget canvas drawing or font scaling).
+        """
+        background = COLORS["background"]
+        row_frame = tk.Frame(self.canvas, bg=background, height=ROW_HEIGHT)
         row_frame.pack_propagate(False)
+        row_frame.item = self.canvas.create_window(
+            ROW_PAD, -ROW_H, window=row_frame, anchor="nw", height=ROW_HEIGHT
+        )
+        row_frame.index = None
+        row_frame.result_index = None
+        row_frame.file_info = None
+        row_frame.color = background
 
-        # Store index for context menu
-        row_frame.index = index
-        row_frame.file_info = file_info
-
-        # Filename
-        filename = file_info.get("filename", "Unknown")
-        path = file_info.get("path", "")
-        modified = file_info.get("modified", "")
-        file_type = file_info.get("type", "file")
-
-        filename_label = ctk.CTkLabel(
+        filename_label = tk.Label(
             row_frame,
-            text=filename,
+            text="",
             font=("Courier", 10),
-            text_color=COLORS["primary"],
+            fg=COLORS["primary"],
+            bg=background,
             anchor="w"
         )
         filename_label.pack(side="left", padx=8, fill="x", expand=True)
 
-        # Path (truncated)
-        truncated_path = path if len(path) < 40 else "..." + path[-37:]
-        path_label = ctk.CTkLabel(
+        path_label = tk.Label(
             row_frame,
-            text=truncated_path,
+            text="",
             font=("Courier", 9),
-            text_color=COLORS["text_secondary"],
+            fg=COLORS["text_secondary"],
+            bg=background,
             anchor="w"
         )
         path_label.pack(side="left", padx=8, fill="x", expand=True)
 
-        # Modified date
-        modified_label = ctk.CTkLabel(
+        modified_label = tk.Label(
             row_frame,
-            text=modified[:10] if modified else "",
+            text="",
             font=("Courier", 9),
-            text_color=COLORS["text_secondary"],
-            width=130
+            fg=COLORS["text_secondary"],
+            bg=background,
+            width=16  # Characters, about the old 130px
         )
         modified_label.pack(side="left", padx=8)
 
-        # File type
-        type_label = ctk.CTkLabel(
+        type_label = tk.Label(
             row_frame,
-            text=file_type[:6],
+            text="",
             font=("Courier", 9),
-            text_color=COLORS["text_secondary"],
-            width=60
+            fg=COLORS["text_secondary"],
+            bg=background,
+            width=7  # Characters, about the old 60px
         )
         type_label.pack(side="left", padx=8)
 
-        # Bind events
-        for label in [filename_label, path_label, modified_label, type_label]:
-            label.bind("<Button-1>", lambda e, r=row_frame: self._on_row_click(r))
-            label.bind("<Button-3>", lambda e, r=row_frame: self._show_context_menu(r, e))
-            label.bind("<Double-Button-1>", lambda e, r=row_frame: self._on_double_click(r))
+        row_frame.labels = (filename_label, path_label, modified_label, type_label)
+
+        # Route the row's events through the shared bindtag (no per-row closures)
+        self._add_row_bindtag(row_frame)
+
+        return row_frame
+
+    def _add_row_bindtag(self, widget):
+        """Prepend the shared row bindtag to a widget and all its descendants."""
+        widget.bindtags((self._row_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_row_bindtag(child)
+
+    def _row_at(self, event) -> Optional[tk.Frame]:
+        """Hit-test an event's screen position to the pooled row showing it."""
+        position = int(self.canvas.canvasy(event.y_root - self.canvas.winfo_rooty()) // ROW_H)
+        for row_frame in self._row_pool:
+            if row_frame.index == position:
+                return row_frame
+        return None
+
+    def _row_of_widget(self, widget) -> Optional[tk.Frame]:
+        """Walk up from an event widget to its pooled row (hover may already have left it)."""
+        while widget is not None and widget is not self.canvas:
+            if hasattr(widget, "result_index"):
+                return widget
+            widget = widget.master
+        return None
+
+    def _dispatch_click(self, event):
+        row_frame = self._row_at(event)
+        if row_frame is not None:
+            self._on_row_click(row_frame)
+
+    def _dispatch_context_menu(self, event):
+        row_frame = self._row_at(event)
+        if row_frame is not None:
+            self._show_context_menu(row_frame, event)
+
+    def _dispatch_double_click(self, event):
+        row_frame = self._row_at(event)
+        if row_frame is not None:
+            self._on_double_click(row_frame)
+
+    def _dispatch_enter(self, event):
+        row_frame = self._row_of_widget(event.widget)
+        if row_frame is not None:
+            self._highlight_row(row_frame, True)
+
+    def _dispatch_leave(self, event):
+        row_frame = self._row_of_widget(event.widget)
+        if row_frame is not None:
+            self._highlight_row(row_frame, False)
+
+    def _bind_row_data(self, row_frame: tk.Frame, index: int):
+        """Reseat a pooled row onto the view entry at ``index``."""
+        result_index = self._view[index]
+        if row_frame.index == index and row_frame.result_index == result_index:
+            return
+
+        row_frame.index = index
+        row_frame.result_index = result_index
+        row_frame.file_info = self.results[result_index]
 
-        # Hover effect
-        row_frame.bind("<Enter>", lambda e, r=row_frame: self._highlight_row(r, True))
-        row_frame.bind("<Leave>", lambda e, r=row_frame: self._highlight_row(r, False))
-        filename_label.bind("<Enter>", lambda e, r=row_frame: self._highlight_row(r, True))
-        filename_label.bind("<Leave>", lambda e, r=row_frame: self._highlight_row(r, False))
-        path_label.bind("<Enter>", lambda e, r=row_frame: self._highlight_row(r, True))
-        path_label.bind("<Leave>", lambda e, r=row_frame: self._highlight_row(r, False))
+        for label, column in zip(row_frame.labels, self._display_cols, strict=True):
+            label.configure(text=column[result_index])
+        self._set_row_color(row_frame, "#E8E8F5" if index == self.selected_row else COLORS["background"])
 
     def _on_row_click(self, row_frame):
         """Handle row selection."""
         # Remove previous selection
-        for widget in self.inner_frame.winfo_children():
-            if isinstance(widget, ctk.CTkFrame):
-                widget.configure(fg_color=COLORS["background"])
+        for other in self._row_pool:
+            self._set_row_color(other, COLORS["background"])
 
         # Highlight selected row
-        row_frame.configure(fg_color="#E8E8F5")
+        self._set_row_color(row_frame, "#E8E8F5")
         self.selected_row = row_frame.index
 
     def _highlight_row(self, row_frame, is_hover):
         """Highlight row on hover."""
-        if is_hover and row_frame != self.selected_row:
-            row_frame.configure(fg_color="#F5F5F9")
-        elif not is_hover and row_frame != self.selected_row:
-            row_frame.configure(fg_color=COLORS["background"])
+        if row_frame.index == self.selected_row:
+            return
+        self._set_row_color(row_frame, "#F5F5F9" if is_hover else COLORS["background"])
+
+    @staticmethod
+    def _set_row_color(row_frame: tk.Frame, color: str):
+        """Paint a row's background (tk labels do not inherit it from the frame)."""
+        if row_frame.color == color:
+            return
+        row_frame.color = color
+        row_frame.configure(bg=color)
+        for label in row_frame.labels:
+            label.configure(bg=color)
 
     def _on_double_click(self, row_frame):
         """Open file on double-click."""
-        file_path = row_frame.file_info.get("path", "")
-        if file_path and os.path.exists(file_path):
+        self._open_file(row_frame.file_info.path)
+
+    def _open_file(self, file_path: str):
+        """Open a file with the platform's default application (existence checked off the UI thread)."""
+        if file_path:
+            self._stat_in_background(file_path, self._post_open_file, file_path)
+
+    def _post_open_file(self, future: Future, file_path: str):
+        """Launch a file once its stat has finished, if it still exists."""
+        if future.result() is not None:
             try:
                 if os.name == "nt":  # Windows
                     os.startfile(file_path)
@@ -459,60 +868,31 @@ class InteractiveResultsPanel(ctk.CTkFrame):
                 self.on_status(f"Error opening file: {e}")
 
     def _show_context_menu(self, row_frame, event):
-        """Show right-click context menu."""
-        file_path = row_frame.file_info.get("path", "")
-        filename = row_frame.file_info.get("filename", "")
+        """Show right-click context menu (existence checked off the UI thread)."""
+        # Target the row's result, not the pooled widget (it may be rebound by a scroll)
+        file_info = row_frame.file_info
+        self._stat_in_background(
+            file_info.path, self._post_context_menu, file_info, event.x_root, event.y_root
+        )
 
-        if not os.path.exists(file_path):
+    def _post_context_menu(self, future: Future, file_info: ResultRow, x_root: int, y_root: int):
+        """Pop up the context menu once the row's file is known to exist."""
+        if future.result() is None:
             self.on_status("File no longer exists")
             return
 
-        # Create context menu with Ayesa branding
-        context_menu = tk.Menu(
-            self.canvas,
-            tearoff=False,
-            bg=COLORS["surface"],
-            fg=COLORS["text_primary"],
-            activebackground=COLORS["primary"],
-            activeforeground=COLORS["background"]
-        )
-
-        context_menu.add_command(
-            label="📋 Copy Full Path",
-            command=lambda: self._copy_to_clipboard(file_path)
-        )
-        context_menu.add_command(
-            label="📄 Copy Filename",
-            command=lambda: self._copy_to_clipboard(filename)
-        )
-        context_menu.add_separator()
-        context_menu.add_command(
-            label="📂 Open File Location",
-            command=lambda: self._open_folder(file_path)
-        )
-        context_menu.add_command(
-            label="▶️ Open File",
-            command=lambda: self._on_double_click(row_frame)
-        )
-        context_menu.add_separator()
-        context_menu.add_command(
-            label="ℹ️ File Properties",
-            command=lambda: self._show_file_info(file_path)
-        )
+        self._menu_row = file_info
 
         # Show menu at cursor position
         try:
-            context_menu.tk_popup(event.x_root, event.y_root)
+            self._context_menu.tk_popup(x_root, y_root)
         finally:
-            context_menu.grab_release()
+            self._context_menu.grab_release()
 
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard."""
         try:
-            # Use tkinter's clipboard functionality
-            self.clipboard_clear()
-            self.clipboard_append(text)
-            self.update()  # Required for clipboard to work
+            set_clipboard(self, text)
             self.on_status(f"Copied: {text[:50]}...")
         except Exception as e:
             self.on_status(f"Copy error: {e}")
@@ -529,12 +909,22 @@ class InteractiveResultsPanel(ctk.CTkFrame):
         except Exception as e:
             self.on_status(f"Error opening folder: {e}")
 
+    def _stat_in_background(self, path: str, callback: Callable, *args):
+        """Stat a path on the panel's I/O worker, then run callback(future, *args) on the UI thread."""
+        future = self._io_pool.submit(self._stat_cache.get, path)
+        future.add_done_callback(lambda f: self.after(0, callback, f, *args))
+
     def _show_file_info(self, file_path: str):
-        """Show file properties in status or dialog."""
+        """Show file properties in status or dialog (stat runs on the panel's I/O worker)."""
+        self._stat_in_background(file_path, self._post_stat, file_path)
+
+    def _post_stat(self, future: Future, file_path: str):
+        """Report a finished file-info stat on the UI thread."""
         try:
-            stat = os.stat(file_path)
+            stat = future.result()
+            if stat is None:
+                raise FileNotFoundError(file_path)
             size_mb = stat.st_size / (1024 * 1024)
-            from datetime import datetime
             mod_time = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
 
             info = f"File: {Path(file_path).name} | Size: {size_mb:.2f} MB | Modified: {mod_time}"
@@ -542,43 +932,59 @@ class InteractiveResultsPanel(ctk.CTkFrame):
         except Exception as e:
             self.on_status(f"Error reading file info: {e}")
 
+    def destroy(self):
+        """Stop the I/O worker along with the panel."""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     def display_analysis_result(self, result: str):
         """Display AI analysis result (text mode)."""
-        # Clear previous content
-        for widget in self.inner_frame.winfo_children():
-            widget.destroy()
+        self._hide_rows()
+        self._clear_messages()
 
-        # Add analysis text with Ayesa branding
-        text_widget = tk.Text(
-            self.inner_frame,
-            bg=COLORS["surface"],
-            fg=COLORS["text_primary"],
-            font=("Courier", 9),
-            wrap="word",
-            height=20,
-            insertbackground=COLORS["primary"]
-        )
+        # Add analysis text with Ayesa branding (widget reused across results)
+        if self._analysis_text is None:
+            self._analysis_text = tk.Text(
+                self.inner_frame,
+                bg=COLORS["surface"],
+                fg=COLORS["text_primary"],
+                font=("Courier", 9),
+                wrap="word",
+                height=20,
+                insertbackground=COLORS["primary"]
+            )
+        text_widget = self._analysis_text
+        text_widget.configure(state="normal")
+        text_widget.delete("1.0", "end")
         text_widget.pack(fill="both", expand=True, padx=10, pady=10)
         text_widget.insert("1.0", result)
         text_widget.configure(state="disabled")
 
         self.title_label.configure(text="Analysis Results", text_color=COLORS["primary"])
-        lines = result.count("\n")
+        if self._analysis_lines[0] is not result:
+            self._analysis_lines = (result, result.count("\n"))
+        lines = self._analysis_lines[1]
         self.count_label.configure(text=f"{lines} lines")
 
     def clear_results(self):
         """Clear all results."""
-        for widget in self.inner_frame.winfo_children():
-            widget.destroy()
+        self._hide_rows()
+        self._clear_messages()
 
         self.count_label.configure(text="")
         self.cache_label.configure(text="")
         self.title_label.configure(text="Results")
         self.results = []
+        self._normalized_rows = []
+        self._sort_keys = {}
+        self._sorted_perm = {}
+        self._haystacks = []
+        self._sorted_rank = {}
+        self._trigram_index = None
+        self._display_cols = ([], [], [], [])
+        self._stat_cache.clear()
+        self._reset_incremental_filter()
         self.selected_row = None
 
-        # Reset canvas
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
 
 import sys
@@ -2,12 +2,15 @@
 
 import logging
 import os
+import queue
+import re
 import sys
 import threading
 import time
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import customtkinter as ctk
 from PIL import Image
@@ -43,6 +46,40 @@ from .treeview_results import TreeviewResultsPanel
 
 logger = logging.getLogger(__name__)
 
+# Worker status messages are coalesced and shown at most this often
+STATUS_POLL_MS = 50
+
+# A successful backend health check is trusted for this many seconds
+HEALTH_CHECK_TTL = 5.0
+
+# Rule line framing formatted analysis headers
+_SEP = "=" * 60
+
+# Search keywords are separated by commas and/or whitespace
+_KW_SPLIT = re.compile(r"[,\s]+")
+
+# Niceness added to worker threads so the Tk thread wins the CPU
+WORKER_NICE_INCREMENT = 5
+
+
+def _lower_worker_priority():
+    """Drop the calling worker thread below normal scheduling priority.
+
+    Runs once per pool thread. Linux applies niceness per thread; on other
+    POSIX systems os.nice would slow the whole process, UI included, so
+    only Linux and Windows are adjusted. Failures are ignored.
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), -1)  # THREAD_PRIORITY_BELOW_NORMAL
+        elif sys.platform.startswith("linux"):
+            os.nice(WORKER_NICE_INCREMENT)
+    except (OSError, AttributeError):
+        pass
+
 
 class ExcelFinderApp(ctk.CTk):
     """Main application window with File Search and AI Analysis tabs."""
@@ -66,11 +103,19 @@ class ExcelFinderApp(ctk.CTk):
 
         # Backend client (for AI features only)
         self.api_client = BackendClient(host="http://localhost:8000")
+        self._health_last_ok: float = 0.0  # time.monotonic() of the last successful health check
 
         # Direct file search (no API needed)
         self.cancel_event = threading.Event()
         self.file_search = FileSearch(cancel_event=self.cancel_event)
-        self.search_thread: Optional[threading.Thread] = None
+
+        # Reused workers for short/cancellable jobs (searches, health checks).
+        # Pool threads are joined at exit, so open-ended analysis and
+        # organizer jobs keep their own daemon threads.
+        self._pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="fe-worker", initializer=_lower_worker_priority
+        )
+        self._search_future: Optional[Future] = None
 
         # State for AI analysis
         self.analysis_thread: Optional[threading.Thread] = None
@@ -83,12 +128,20 @@ class ExcelFinderApp(ctk.CTk):
         self.current_search_results: list = []
         self.search_is_cached: bool = False
 
+        # Status messages posted by worker threads, drained on the UI thread
+        self._status_queue: "queue.Queue[str]" = queue.Queue()
+        self._status_after_id: Optional[str] = None
+        self._last_status: Tuple[Optional[str], Optional[str]] = (None, None)  # (message, color) on screen
+
         # Build UI
         self._build_ui()
 
         # Check backend connection on startup (for AI features)
         self._check_backend_connection()
 
+        # Start draining worker status messages
+        self._status_after_id = self.after(STATUS_POLL_MS, self._drain_status)
+
         # Set close handler
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
 
@@ -218,26 +271,54 @@ class ExcelFinderApp(ctk.CTk):
         # Reference for backward compatibility
         self.results_panel = self.search_results_panel
 
-        # Progress bar (hidden initially)
-        self.progress_bar = ctk.CTkProgressBar(content_frame, height=8)
+        # Progress bar keeps its pack slot; _set_busy collapses it to zero height when idle
+        self._busy = False
+        self.progress_bar = ctk.CTkProgressBar(content_frame, height=0, mode="indeterminate")
         self.progress_bar.set(0)
-        self.progress_bar.pack(fill="x", pady=(10, 0))
-        self.progress_bar.pack_forget()  # Hide initially
+        self.progress_bar.pack(fill="x", pady=0)
+
+    def _set_busy(self, on: bool):
+        """Show and animate the progress bar while work runs; collapse it when idle."""
+        if on == self._busy:
+            return
+        self._busy = on
+        if on:
+            self.progress_bar.set(0)
+            self.progress_bar.configure(height=8)
+            self.progress_bar.pack_configure(pady=(10, 0))
+            self.progress_bar.start()
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.configure(height=0)
+            self.progress_bar.pack_configure(pady=0)
 
     def _check_backend_connection(self):
         """Check if backend is running (for AI features)."""
         def check():
-            is_connected = self.api_client.health_check()
+            is_connected = self._is_backend_up()
             if is_connected:
-                self.after(0, lambda: self._update_status("Ready (AI available)", color="#52CC52"))
+                self.after(0, self._update_status, "Ready (AI available)", "#52CC52")
             else:
-                self.after(0, lambda: self._update_status("Ready (AI offline)", color="#FFB347"))
+                self.after(0, self._update_status, "Ready (AI offline)", "#FFB347")
+
+        self._pool.submit(check)
 
-        thread = threading.Thread(target=check, daemon=True)
-        thread.start()
+    def _is_backend_up(self) -> bool:
+        """Health-check the backend, reusing a recent success (blocking; call off the UI thread)."""
+        if time.monotonic() - self._health_last_ok < HEALTH_CHECK_TTL:
+            return True
+        is_up = self.api_client.health_check()
+        if is_up:
+            self._health_last_ok = time.monotonic()
+        return is_up
 
     def _update_status(self, message: str, color: str = "#FFB347"):
         """Update status label (thread-safe)."""
+        # Skip the repaint when the label already shows this message
+        key = (message, color)
+        if key == self._last_status:
+            return
+        self._last_status = key
         self.status_label.configure(text=message, text_color=color)
 
     # ==================== FILE SEARCH (Direct Python - No API) ====================
@@ -247,6 +328,11 @@ class ExcelFinderApp(ctk.CTk):
                          exclude_keywords: list = None, file_extensions: list = None,
                          min_size: int = None, max_size: int = None):
         """Start file search directly (no API needed)."""
+        # The pool has two workers; never let two searches share cancel_event and the results panel
+        if self._search_future is not None and not self._search_future.done():
+            self._update_status("A search is already running", color="#FFB347")
+            return
+
         if not keyword.strip():
             self._update_status("Please enter search keywords", color="#FF6B6B")
             return
@@ -255,6 +341,14 @@ class ExcelFinderApp(ctk.CTk):
             self._update_status("Please select at least one folder", color="#FF6B6B")
             return
 
+        # Convert date strings to date objects before committing to a search
+        try:
+            parsed_start = date.fromisoformat(start_date) if start_date else None
+            parsed_end = date.fromisoformat(end_date) if end_date else None
+        except ValueError:
+            self._update_status("Invalid date format (use YYYY-MM-DD)", color="#FF6B6B")
+            return
+
         # Reset cancel event and clear previous results
         self.cancel_event.clear()
         self.search_results_panel.clear_results()
@@ -262,42 +356,28 @@ class ExcelFinderApp(ctk.CTk):
         # Update UI state
         self.search_panel.set_searching_state(True)
         self._update_status("Starting search...", color="#FFB347")
-        self.progress_bar.pack(fill="x", pady=(10, 0))
-        self.progress_bar.set(0)
-        self.progress_bar.configure(mode="indeterminate")
-        self.progress_bar.start()
-
-        # Run search in background thread
-        self.search_thread = threading.Thread(
-            target=self._run_search,
-            args=(keyword, folders, case_sensitive, start_date, end_date, exclude_keywords,
-                  file_extensions, min_size, max_size),
-            daemon=True
+        self._set_busy(True)
+
+        # Run search on the worker pool
+        self._search_future = self._pool.submit(
+            self._run_search,
+            keyword, folders, case_sensitive, parsed_start, parsed_end, exclude_keywords,
+            file_extensions, min_size, max_size
         )
-        self.search_thread.start()
 
     def _run_search(self, keyword: str, folders: list, case_sensitive: bool,
-                    start_date: str = None, end_date: str = None,
+                    start_date: Optional[date] = None, end_date: Optional[date] = None,
                     exclude_keywords: list = None, file_extensions: list = None,
                     min_size: int = None, max_size: int = None):
         """Background search worker with status callbacks and progressive result display."""
         try:
             # Split keywords by space or comma
-            keywords = [k.strip() for k in keyword.replace(',', ' ').split() if k.strip()]
+            keywords = [k for k in _KW_SPLIT.split(keyword) if k]
 
             # Handle exclude keywords
             if exclude_keywords is None:
                 exclude_keywords = []
 
-            # Convert date strings to date objects if provided
-            parsed_start = None
-            parsed_end = None
-
-            if start_date:
-                parsed_start = datetime.strptime(start_date, '%Y-%m-%d').date()
-            if end_date:
-                parsed_end = datetime.strptime(end_date, '%Y-%m-%d').date()
-
             # Check if using cache (file_search.index is available)
             is_cached = hasattr(self.file_search, 'index') and self.file_search.index is not None
             self.search_is_cached = is_cached
@@ -314,15 +394,15 @@ class ExcelFinderApp(ctk.CTk):
                 current_count = len(self.current_search_results)
                 if current_count > 0 and current_count - last_display_count >= 50:
                     last_display_count = current_count
-                    self.after(0, lambda r=list(self.current_search_results), c=is_cached:
-                              self._display_results_incrementally(r, c))
+                    self.after(0, self._display_results_incrementally,
+                               list(self.current_search_results), is_cached)
 
             results = self.file_search.search_by_filename(
                 folder_paths=folders,
                 filename_keywords=keywords,
                 case_sensitive=case_sensitive,
-                start_date=parsed_start,
-                end_date=parsed_end,
+                start_date=start_date,
+                end_date=end_date,
                 exclude_keywords=exclude_keywords,
                 supported_extensions=tuple(file_extensions) if file_extensions else None,
                 status_callback=status_callback_with_display,
@@ -353,16 +433,32 @@ class ExcelFinderApp(ctk.CTk):
             self.current_search_results = results
 
             # Update UI on main thread with cache status
-            self.after(0, lambda r=results, c=is_cached: self._on_search_complete(r, c))
+            self.after(0, self._on_search_complete, results, is_cached)
 
         except Exception as e:
             logger.error(f"Search error: {e}")
-            self.after(0, lambda: self._on_search_error(str(e)))
+            self.after(0, self._on_search_error, str(e))
 
     def _on_search_status(self, message: str):
         """Called by FileSearch with progress updates."""
-        # Schedule UI update on main thread
-        self.after(0, lambda: self._update_status(message, color="#FFB347"))
+        # Queue for the UI thread; only the latest message per poll is shown
+        self._status_queue.put_nowait(message)
+
+    def _take_pending_status(self) -> Optional[str]:
+        """Empty the status queue, returning the newest message (if any)."""
+        message = None
+        while True:
+            try:
+                message = self._status_queue.get_nowait()
+            except queue.Empty:
+                return message
+
+    def _drain_status(self):
+        """Show the latest queued worker status, then poll again."""
+        message = self._take_pending_status()
+        if message is not None:
+            self._update_status(message, color="#FFB347")
+        self._status_after_id = self.after(STATUS_POLL_MS, self._drain_status)
 
     def _on_search_result(self, result: dict):
         """Called when each file is found (for future use with result streaming)."""
@@ -382,9 +478,11 @@ class ExcelFinderApp(ctk.CTk):
 
     def _on_search_complete(self, results: list, is_cached: bool = False):
         """Called when search finishes."""
+        # Drop queued progress so it cannot overwrite the final status
+        self._take_pending_status()
+
         # Stop progress bar
-        self.progress_bar.stop()
-        self.progress_bar.pack_forget()
+        self._set_busy(False)
 
         # Reset UI state
         self.search_panel.set_searching_state(False)
@@ -401,9 +499,10 @@ class ExcelFinderApp(ctk.CTk):
 
     def _on_search_error(self, error: str):
         """Called when search encounters an error."""
+        self._take_pending_status()
+
         # Stop progress bar
-        self.progress_bar.stop()
-        self.progress_bar.pack_forget()
+        self._set_busy(False)
 
         # Reset UI state
         self.search_panel.set_searching_state(False)
@@ -420,11 +519,6 @@ class ExcelFinderApp(ctk.CTk):
             self._update_status("No file selected", color="#FF6B6B")
             return
 
-        # Check backend connection first
-        if not self.api_client.health_check():
-            self._update_status("Backend offline. Start backend first.", color="#FF6B6B")
-            return
-
         # Disable UI and show progress
         self.analysis_panel.disable_upload_button()
 
@@ -437,9 +531,7 @@ class ExcelFinderApp(ctk.CTk):
             self.analysis_panel.show_progress(f"Analyzing ({analysis_type})")
 
         # Show indeterminate progress bar
-        self.progress_bar.pack(fill="x", pady=(10, 0))
-        self.progress_bar.configure(mode="indeterminate")
-        self.progress_bar.start()
+        self._set_busy(True)
 
         # Track start time for elapsed display
         self.analysis_start_time = time.time()
@@ -455,6 +547,11 @@ class ExcelFinderApp(ctk.CTk):
     def _run_analysis(self, file_path_or_list, analysis_type: str = "summary"):
         """Background worker for file/batch analysis. Only calls self.after() once at the end."""
         try:
+            # Check backend connection first (here, so the click never blocks on HTTP)
+            if not self._is_backend_up():
+                self.after(0, self._on_analysis_error, "Backend offline. Start backend first.")
+                return
+
             # Determine if batch or single file
             is_batch = isinstance(file_path_or_list, list)
 
@@ -473,7 +570,7 @@ class ExcelFinderApp(ctk.CTk):
                     successful = result.get("successful", 0)
                     failed = result.get("failed", 0)
 
-                    formatted_result = self._format_batch_result(
+                    formatted_result, line_count = self._format_batch_result(
                         summary,
                         file_count,
                         successful,
@@ -498,7 +595,7 @@ class ExcelFinderApp(ctk.CTk):
                     timing = result.get("timing", {"total_ms": latency_ms})
 
                     # Format result with metadata
-                    formatted_result = self._format_analysis_result(
+                    formatted_result, line_count = self._format_analysis_result(
                         analysis_text,
                         file_info,
                         timing,
@@ -506,24 +603,25 @@ class ExcelFinderApp(ctk.CTk):
                     )
 
                 # Schedule UI update on main thread - ONLY self.after() call
-                self.after(0, lambda r=formatted_result: self._on_analysis_complete(r))
+                self.after(0, self._on_analysis_complete, formatted_result, line_count)
             else:
                 error = result.get("error", "Unknown error")
                 # Schedule UI update on main thread - ONLY self.after() call
-                self.after(0, lambda e=error: self._on_analysis_error(e))
+                self.after(0, self._on_analysis_error, error)
 
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Analysis error: {error_msg}")
             # Schedule UI update on main thread - ONLY self.after() call
-            self.after(0, lambda msg=error_msg: self._on_analysis_error(msg))
+            self.after(0, self._on_analysis_error, error_msg)
 
-    def _format_batch_result(self, summary: str, file_count: int, successful: int, failed: int, analysis_type: str) -> str:
-        """Format batch analysis result with summary and statistics."""
+    def _format_batch_result(self, summary: str, file_count: int, successful: int, failed: int,
+                             analysis_type: str) -> Tuple[str, int]:
+        """Format batch analysis result with summary and statistics; returns (text, line count)."""
         header_lines = [
-            "=" * 60,
+            _SEP,
             "BATCH ANALYSIS RESULTS",
-            "=" * 60,
+            _SEP,
             f"Files analyzed: {successful}/{file_count} successful",
         ]
 
@@ -532,47 +630,52 @@ class ExcelFinderApp(ctk.CTk):
 
         header_lines.extend([
             f"Analysis type: {analysis_type}",
-            "=" * 60,
+            _SEP,
             ""
         ])
 
+        # Count lines while formatting so the results panel never rescans the text
+        line_count = len(header_lines) + summary.count("\n") + 1
+
         # Add the consolidated summary
         header_lines.append(summary)
 
-        return "\n".join(header_lines)
-
-    def _format_analysis_result(self, analysis: str, file_info: dict, timing: dict, model: str) -> str:
-        """Format analysis result with metadata header."""
-        header_lines = [
-            "=" * 60,
-            "AI DOCUMENT ANALYSIS",
-            "=" * 60,
-            f"File: {file_info.get('name', 'Unknown')}",
-            f"Type: {file_info.get('type', 'Unknown')}",
-            f"Size: {file_info.get('size', 0) / 1024:.1f} KB",
-        ]
-
-        if file_info.get('pages', 0) > 1:
-            header_lines.append(f"Pages: {file_info.get('pages')}")
-
-        if timing:
-            total_ms = timing.get('total_ms', 0)
-            header_lines.append(f"Processing time: {total_ms / 1000:.1f}s")
-
-        header_lines.extend([
-            f"Model: {model}",
-            "=" * 60,
-            "",
-            analysis
-        ])
+        return "\n".join(header_lines), line_count
+
+    def _format_analysis_result(self, analysis: str, file_info: dict, timing: dict,
+                                model: str) -> Tuple[str, int]:
+        """Format analysis result with metadata header; returns (text, line count)."""
+        # Read each metadata field once
+        name = file_info.get('name', 'Unknown')
+        file_type = file_info.get('type', 'Unknown')
+        size_kb = file_info.get('size', 0) / 1024
+        pages = file_info.get('pages', 0)
+
+        pages_line = f"Pages: {pages}\n" if pages > 1 else ""
+        timing_line = f"Processing time: {timing.get('total_ms', 0) / 1000:.1f}s\n" if timing else ""
+
+        header = (
+            f"{_SEP}\n"
+            "AI DOCUMENT ANALYSIS\n"
+            f"{_SEP}\n"
+            f"File: {name}\n"
+            f"Type: {file_type}\n"
+            f"Size: {size_kb:.1f} KB\n"
+            f"{pages_line}"
+            f"{timing_line}"
+            f"Model: {model}\n"
+            f"{_SEP}\n"
+            "\n"
+        )
 
-        return "\n".join(header_lines)
+        # Count lines while formatting so the results panel never rescans the text
+        line_count = header.count("\n") + analysis.count("\n") + 1
+        return header + analysis, line_count
 
-    def _on_analysis_complete(self, result: str):
+    def _on_analysis_complete(self, result: str, line_count: Optional[int] = None):
         """Called when analysis finishes successfully."""
         # Stop progress bar
-        self.progress_bar.stop()
-        self.progress_bar.pack_forget()
+        self._set_busy(False)
 
         # Calculate total elapsed time
         elapsed = time.time() - self.analysis_start_time
@@ -586,13 +689,12 @@ class ExcelFinderApp(ctk.CTk):
         self._update_status(f"Analysis complete ({elapsed:.1f}s)", color="#52CC52")
 
         # Display results in analysis tab's independent results panel
-        self.analysis_results_panel.display_analysis_result(result)
+        self.analysis_results_panel.display_analysis_result(result, line_count)
 
     def _on_analysis_error(self, error: str):
         """Called when analysis encounters an error."""
         # Stop progress bar
-        self.progress_bar.stop()
-        self.progress_bar.pack_forget()
+        self._set_busy(False)
 
         # Stop progress indicator
         self.analysis_panel.hide_progress("Error")
@@ -610,9 +712,7 @@ class ExcelFinderApp(ctk.CTk):
         self.organizer_results_panel.clear_results() if hasattr(self.organizer_results_panel, 'clear_results') else None
 
         # Show progress bar
-        self.progress_bar.pack(fill="x", pady=(10, 0))
-        self.progress_bar.configure(mode="indeterminate")
-        self.progress_bar.start()
+        self._set_busy(True)
 
         # Start background thread
         self.organizer_thread = threading.Thread(
@@ -631,40 +731,39 @@ class ExcelFinderApp(ctk.CTk):
 
             # Discover files
             file_count = organizer.discover_files()
-            self.after(0, lambda: self._update_status(f"Found {file_count} files..."))
+            self.after(0, self._update_status, f"Found {file_count} files...")
 
             if file_count == 0:
-                self.after(0, lambda: self._on_organize_error("No supported files found"))
+                self.after(0, self._on_organize_error, "No supported files found")
                 return
 
             # Extract text
             success_count = organizer.extract_all_texts()
-            self.after(0, lambda: self._update_status(f"Extracted {success_count} files, clustering..."))
+            self.after(0, self._update_status, f"Extracted {success_count} files, clustering...")
 
             if success_count == 0:
-                self.after(0, lambda: self._on_organize_error("Could not extract text from any files"))
+                self.after(0, self._on_organize_error, "Could not extract text from any files")
                 return
 
             # Cluster
             if not organizer.cluster_files():
-                self.after(0, lambda: self._on_organize_error("Clustering failed"))
+                self.after(0, self._on_organize_error, "Clustering failed")
                 return
 
             # Get results
             results = organizer.get_results()
 
             # Update UI on main thread
-            self.after(0, lambda r=results, c=success_count: self._on_organize_complete(r, c))
+            self.after(0, self._on_organize_complete, results, success_count)
 
         except Exception as e:
             logger.error(f"Organization error: {e}", exc_info=True)
-            self.after(0, lambda: self._on_organize_error(str(e)))
+            self.after(0, self._on_organize_error, str(e))
 
     def _on_organize_complete(self, results: list, file_count: int):
         """Handle successful organization completion (UI thread)."""
         # Stop progress bar
-        self.progress_bar.stop()
-        self.progress_bar.pack_forget()
+        self._set_busy(False)
 
         # Re-enable controls
         self.organizer_panel.enable_controls()
@@ -679,8 +778,7 @@ class ExcelFinderApp(ctk.CTk):
     def _on_organize_error(self, error: str):
         """Handle organization error (UI thread)."""
         # Stop progress bar
-        self.progress_bar.stop()
-        self.progress_bar.pack_forget()
+        self._set_busy(False)
 
         # Re-enable controls
         self.organizer_panel.enable_controls()
@@ -692,6 +790,9 @@ class ExcelFinderApp(ctk.CTk):
         try:
             # Cancel any ongoing search
             self.cancel_event.set()
+            if self._status_after_id is not None:
+                self.after_cancel(self._status_after_id)
+            self._pool.shutdown(wait=False, cancel_futures=True)
             self.api_client.close()
             self.destroy()
         except Exception as e:
@@ -124,10 +124,7 @@ class OrganizerPanel(ctk.CTkFrame):
         self.cluster_label.pack(side="left")
 
         # Update label when slider changes
-        def _on_cluster_change(value):
-            self.cluster_label.configure(text=str(int(value)))
-
-        self.cluster_slider.configure(command=_on_cluster_change)
+        self.cluster_slider.configure(command=self._on_cluster_change)
 
         # Language selection frame
         lang_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -194,6 +191,10 @@ class OrganizerPanel(ctk.CTkFrame):
         )
         self.clear_button.pack(side="left", padx=(5, 0))
 
+    def _on_cluster_change(self, value):
+        """Show the slider's current cluster count."""
+        self.cluster_label.configure(text=str(int(value)))
+
     def _on_folder_select(self):
         """Handle folder selection."""
         folder = filedialog.askdirectory(title="Select folder to organize")
@@ -4,12 +4,18 @@ from typing import Any, Dict, List
 
 import customtkinter as ctk
 
+RESULTS_PAGE_SIZE = 500  # Results rendered per page of the textbox
+LOAD_MORE_THRESHOLD = 0.9  # Scroll fraction past which the next page is appended
+
 
 class ResultsPanel(ctk.CTkFrame):
     """Panel for displaying file search and analysis results."""
 
     def __init__(self, parent):
         super().__init__(parent, fg_color="#1a1a1a")
+        self._results: List[Dict[str, Any]] = []  # Full result list; rendered page by page
+        self._rendered = 0  # Number of results already in the textbox
+        self._load_pending = False  # A page append is scheduled
 
         self._build_ui()
 
@@ -34,14 +40,58 @@ class ResultsPanel(ctk.CTkFrame):
         )
         self.count_label.pack(side="right")
 
-        # Results text widget
+        # Results text widget; its own scrollbar drives page loading
+        text_frame = ctk.CTkFrame(self, fg_color="transparent")
+        text_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+
+        self.scrollbar = ctk.CTkScrollbar(text_frame)
+        self.scrollbar.pack(side="right", fill="y")
+
         self.results_text = ctk.CTkTextbox(
-            self,
+            text_frame,
             font=("Courier", 9),
             wrap="word",
-            activate_scrollbars=True
+            activate_scrollbars=False
         )
-        self.results_text.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        self.results_text.pack(side="left", fill="both", expand=True)
+        # CTkTextbox's constructor wires yscrollcommand to its own scrollbar, so hook it afterwards
+        self.results_text.configure(state="disabled", yscrollcommand=self._on_text_yscroll)
+        self.scrollbar.configure(command=self.results_text.yview)
+
+    def _on_text_yscroll(self, first: str, last: str):
+        """Track the textbox view; queue the next page as the end comes into view."""
+        self.scrollbar.set(first, last)
+        if (not self._load_pending and self._rendered < len(self._results)
+                and float(last) >= LOAD_MORE_THRESHOLD):
+            self._load_pending = True
+            self.after_idle(self._append_page)
+
+    def _append_page(self):
+        """Render the next page of results at the end of the textbox."""
+        self._load_pending = False
+        start = self._rendered
+        end = min(start + RESULTS_PAGE_SIZE, len(self._results))
+        if start >= end:
+            return
+
+        # Format results nicely, then hand Tk the whole page in one insert of (text, tag) pairs
+        parts = []
+        for i, file_info in enumerate(self._results[start:end], start + 1):
+            filename = file_info.get("filename", "Unknown")
+            path = file_info.get("path", "")
+            modified = file_info.get("modified_date", "")
+
+            # Header for each file
+            parts += (f"{i}. {filename}\n", "filename", f"   Path: {path}\n", "info")
+            if modified:
+                parts += (f"   Modified: {modified}\n", "info")
+            parts += ("\n", "")
+        self._rendered = end
+
+        self.results_text.configure(state="normal")
+        # CTkTextbox.insert() forwards a single text/tags pair, so a whole tagged page
+        # in one Tk call has to go through the wrapped tk.Text, whose insert takes many
+        self.results_text._textbox.insert("end", *parts)
         self.results_text.configure(state="disabled")
 
     def display_results(self, results: List[Dict[str, Any]]):
@@ -51,29 +101,26 @@ class ResultsPanel(ctk.CTkFrame):
         Args:
             results: List of file result dicts with keys: filename, path, modified_date
         """
+        self._reset_pages()
         self.results_text.configure(state="normal")
         self.results_text.delete("1.0", "end")
 
         if not results:
             self.results_text.insert("end", "No files found.")
+            self.results_text.configure(state="disabled")
             self.count_label.configure(text="0 files")
-        else:
-            # Format results nicely
-            for i, file_info in enumerate(results, 1):
-                filename = file_info.get("filename", "Unknown")
-                path = file_info.get("path", "")
-                modified = file_info.get("modified_date", "")
-
-                # Header for each file
-                self.results_text.insert("end", f"{i}. {filename}\n", "filename")
-                self.results_text.insert("end", f"   Path: {path}\n", "info")
-                if modified:
-                    self.results_text.insert("end", f"   Modified: {modified}\n", "info")
-                self.results_text.insert("end", "\n")
-
-            self.count_label.configure(text=f"{len(results)} files found")
+            return
 
         self.results_text.configure(state="disabled")
+        # Only the first page is rendered now; scrolling near the end loads more
+        self._results = results
+        self._append_page()
+        self.count_label.configure(text=f"{len(results)} files found")
+
+    def _reset_pages(self):
+        """Forget the paged result list."""
+        self._results = []
+        self._rendered = 0
 
     def display_analysis_result(self, result: str):
         """
@@ -82,6 +129,7 @@ class ResultsPanel(ctk.CTkFrame):
         Args:
             result: Analysis result text
         """
+        self._reset_pages()
         self.results_text.configure(state="normal")
         self.results_text.delete("1.0", "end")
         self.results_text.insert("1.0", result)
@@ -93,6 +141,7 @@ class ResultsPanel(ctk.CTkFrame):
 
     def clear_results(self):
         """Clear all results."""
+        self._reset_pages()
         self.results_text.configure(state="normal")
         self.results_text.delete("1.0", "end")
         self.results_text.configure(state="disabled")
@@ -1,12 +1,11 @@
 """File search panel component."""
 
+import functools
 import os
 import re
 import sys
-import tkinter.filedialog as filedialog
-from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 
@@ -20,6 +19,58 @@ except ImportError:
         sys.path.insert(0, parent_dir)
     from branding import COLORS, FONTS
 
+# Custom extensions are separated by commas and/or whitespace
+_CUSTOM_EXT_SPLIT_RE = re.compile(r"[,\s]+")
+
+# File type dropdown choices and the extensions each one selects
+_TYPE_MAP = {
+    "All": (),
+    "Documents (.docx, .pdf, .txt)": (".docx", ".pdf", ".txt", ".doc"),
+    "Spreadsheets (.xlsx, .xls, .csv)": (".xlsx", ".xls", ".csv", ".xlsm"),
+    "Images (.png, .jpg, .jpeg, .gif)": (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff"),
+    "Archives (.zip, .rar, .7z)": (".zip", ".rar", ".7z", ".tar", ".gz"),
+}
+
+# Bytes per size unit; unknown units are treated as MB
+_UNIT_MULT = {"KB": 1024, "MB": 1024 * 1024, "GB": 1024 * 1024 * 1024}
+
+# Dropdown choices, derived from the tables above so they can't drift apart
+_FILE_TYPE_VALUES = (*_TYPE_MAP, "Custom...")
+_SIZE_UNIT_VALUES = tuple(_UNIT_MULT)
+
+
+@functools.lru_cache(maxsize=1)
+def _compute_default_folders() -> tuple:
+    """Default search folders from DEFAULT_SEARCH_FOLDERS, else Desktop and Downloads."""
+    # Skip blanks left by stray or trailing commas
+    default = os.getenv("DEFAULT_SEARCH_FOLDERS", "")
+    folders = tuple(f for f in (p.strip() for p in default.split(",")) if f)
+    if folders:
+        return folders
+
+    # Fallback to Desktop and Downloads
+    home = os.path.expanduser("~")
+    return (os.path.join(home, "Desktop"), os.path.join(home, "Downloads"))
+
+
+@functools.lru_cache(maxsize=128)
+def _is_valid_date(date_str: str) -> bool:
+    """Whether a non-empty, stripped string is a real YYYY-MM-DD date (memoized per string)."""
+    # Check format; isdecimal keeps int() from accepting signs, spaces or underscores
+    year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+    if (len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-"
+            or not (year.isdecimal() and month.isdecimal() and day.isdecimal())):
+        return False
+
+    # Validate it's a real date (the constructor checks month/day ranges)
+    from datetime import datetime  # Deferred: only needed once a date filter is entered
+
+    try:
+        datetime(int(year), int(month), int(day))
+        return True
+    except ValueError:
+        return False
+
 
 class SearchPanel(ctk.CTkFrame):
     """File search panel with keyword input and folder selection."""
@@ -36,35 +87,69 @@ class SearchPanel(ctk.CTkFrame):
         self.on_cancel = on_cancel_callback
         self.on_status = on_status_callback
 
-        # Default folders from environment
-        self.search_folders = self._get_default_folders()
+        # Default folders from environment (dict used as an insertion-ordered set)
+        self.search_folders: Dict[str, None] = dict.fromkeys(self._get_default_folders())
+
+        # Folders currently shown in folder_text (None until first render)
+        self._last_folder_render: Optional[Tuple[str, ...]] = None
+
+        # Last (file type, custom text) and the extensions it resolved to
+        self._ext_cache_key: Optional[Tuple[str, str]] = None
+        self._ext_cache: Tuple[str, ...] = ()
+
+        # Widgets created by _build_ui (date row and cancel/custom widgets on demand)
+        self.keyword_entry: Optional[ctk.CTkEntry] = None
+        self.case_sensitive_var: Optional[ctk.BooleanVar] = None
+        self.case_sensitive_check: Optional[ctk.CTkCheckBox] = None
+        self._date_frame: Optional[ctk.CTkFrame] = None
+        self.date_filter_button: Optional[ctk.CTkButton] = None
+        self.start_date_entry: Optional[ctk.CTkEntry] = None
+        self.end_date_entry: Optional[ctk.CTkEntry] = None
+        self.clear_dates_button: Optional[ctk.CTkButton] = None
+        self.exclude_entry: Optional[ctk.CTkEntry] = None
+        self.file_type_var: Optional[ctk.StringVar] = None
+        self.file_type_dropdown: Optional[ctk.CTkComboBox] = None
+        self._filetype_frame: Optional[ctk.CTkFrame] = None
+        self.custom_file_types_entry: Optional[ctk.CTkEntry] = None
+        self.min_size_entry: Optional[ctk.CTkEntry] = None
+        self.max_size_entry: Optional[ctk.CTkEntry] = None
+        self.size_unit_var: Optional[ctk.StringVar] = None
+        self.size_unit_dropdown: Optional[ctk.CTkComboBox] = None
+        self.folder_text: Optional[ctk.CTkLabel] = None
+        self.button_container: Optional[ctk.CTkFrame] = None
+        self.search_button: Optional[ctk.CTkButton] = None
+        self.cancel_button: Optional[ctk.CTkButton] = None
+        self._input_widgets: Tuple = ()
 
         self._build_ui()
 
     def _get_default_folders(self) -> List[str]:
         """Get default search folders from environment or use Desktop/Downloads."""
-        try:
-            default = os.getenv("DEFAULT_SEARCH_FOLDERS", "")
-            if default:
-                return [f.strip() for f in default.split(",")]
-        except:
-            pass
-
-        # Fallback to Desktop and Downloads
-        username = os.getenv("USERNAME", "User")
-        return [
-            f"C:\\Users\\{username}\\Desktop",
-            f"C:\\Users\\{username}\\Downloads"
-        ]
+        return list(_compute_default_folders())
 
     def _build_ui(self):
         """Build search panel layout with Ayesa branding."""
+        # Style values used throughout the layout
+        primary, accent = COLORS["primary"], COLORS["accent"]
+        surface, background, border = COLORS["surface"], COLORS["background"], COLORS["border"]
+        text_primary, text_secondary = COLORS["text_primary"], COLORS["text_secondary"]
+        font_heading, font_body, font_small = FONTS["heading"], FONTS["body"], FONTS["small"]
+
+        # Shared widget styles
+        entry_kwargs = {
+            "height": 35, "font": font_body, "fg_color": surface, "text_color": text_secondary,
+            "border_color": primary, "border_width": 1,
+        }
+        accent_btn_kwargs = {
+            "font": font_small, "fg_color": accent, "text_color": background, "hover_color": "#E01670",
+        }
+
         # Title
         title = ctk.CTkLabel(
             self,
             text="File Search",
-            font=FONTS["heading"],
-            text_color=COLORS["primary"]
+            font=font_heading,
+            text_color=primary
         )
         title.pack(padx=15, pady=(10, 5), anchor="w")
 
@@ -75,22 +160,17 @@ class SearchPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             keyword_frame,
             text="Keywords:",
-            font=FONTS["body"],
-            text_color=COLORS["text_primary"]
+            font=font_body,
+            text_color=text_primary
         ).pack(side="left", padx=(0, 10))
 
         self.keyword_entry = ctk.CTkEntry(
             keyword_frame,
             placeholder_text="e.g., invoice, report, data...",
-            height=35,
-            font=FONTS["body"],
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"],
-            border_color=COLORS["primary"],
-            border_width=1
+            **entry_kwargs
         )
         self.keyword_entry.pack(side="left", fill="x", expand=True)
-        self.keyword_entry.bind("<Return>", lambda e: self._on_search_clicked())
+        self.keyword_entry.bind("<Return>", self._on_return)
 
         # Case sensitive checkbox
         self.case_sensitive_var = ctk.BooleanVar(value=False)
@@ -98,78 +178,37 @@ class SearchPanel(ctk.CTkFrame):
             keyword_frame,
             text="Case Sensitive",
             variable=self.case_sensitive_var,
-            font=FONTS["small"],
-            text_color=COLORS["text_primary"],
-            fg_color=COLORS["primary"],
+            font=font_small,
+            text_color=text_primary,
+            fg_color=primary,
             hover_color="#0000A8",
-            border_color=COLORS["primary"]
+            border_color=primary
         )
         self.case_sensitive_check.pack(side="left", padx=(10, 0))
 
-        # Date range frame
-        date_frame = ctk.CTkFrame(self, fg_color="transparent")
-        date_frame.pack(fill="x", padx=15, pady=4)
+        # Date range frame - the From/To row is built when first expanded
+        self._date_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self._date_frame.pack(fill="x", padx=15, pady=4)
 
         ctk.CTkLabel(
-            date_frame,
+            self._date_frame,
             text="Date:",
-            font=FONTS["small"],
-            text_color=COLORS["text_primary"]
+            font=font_small,
+            text_color=text_primary
         ).pack(side="left", padx=(0, 5))
 
-        # Start date
-        ctk.CTkLabel(
-            date_frame,
-            text="From:",
-            font=FONTS["small"],
-            text_color=COLORS["text_primary"]
-        ).pack(side="left", padx=(5, 2))
-        self.start_date_entry = ctk.CTkEntry(
-            date_frame,
-            placeholder_text="YYYY-MM-DD",
-            width=95,
-            height=25,
-            font=FONTS["small"],
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"],
-            border_color=COLORS["primary"],
-            border_width=1
-        )
-        self.start_date_entry.pack(side="left", padx=(0, 5))
-
-        # End date
-        ctk.CTkLabel(
-            date_frame,
-            text="To:",
-            font=FONTS["small"],
-            text_color=COLORS["text_primary"]
-        ).pack(side="left", padx=(5, 2))
-        self.end_date_entry = ctk.CTkEntry(
-            date_frame,
-            placeholder_text="YYYY-MM-DD",
-            width=95,
-            height=25,
-            font=FONTS["small"],
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"],
-            border_color=COLORS["primary"],
-            border_width=1
-        )
-        self.end_date_entry.pack(side="left", padx=(0, 5))
-
-        # Clear dates button
-        self.clear_dates_button = ctk.CTkButton(
-            date_frame,
-            text="Clear",
-            width=50,
+        self.date_filter_button = ctk.CTkButton(
+            self._date_frame,
+            text="Add date filter",
+            width=100,
             height=25,
-            font=FONTS["small"],
-            fg_color=COLORS["accent"],
-            text_color=COLORS["background"],
-            hover_color="#E01670",
-            command=self._clear_dates
+            font=font_small,
+            fg_color=primary,
+            text_color=background,
+            hover_color="#0000A8",
+            command=self._show_date_filter
         )
-        self.clear_dates_button.pack(side="left", padx=(2, 0))
+        self.date_filter_button.pack(side="left", padx=(5, 0))
 
         # Exclude keywords frame
         exclude_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -178,19 +217,14 @@ class SearchPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             exclude_frame,
             text="Exclude:",
-            font=FONTS["body"],
-            text_color=COLORS["text_primary"]
+            font=font_body,
+            text_color=text_primary
         ).pack(side="left", padx=(0, 10))
 
         self.exclude_entry = ctk.CTkEntry(
             exclude_frame,
             placeholder_text="e.g., temp, backup, old...",
-            height=35,
-            font=FONTS["body"],
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"],
-            border_color=COLORS["primary"],
-            border_width=1
+            **entry_kwargs
         )
         self.exclude_entry.pack(side="left", fill="x", expand=True)
 
@@ -201,37 +235,27 @@ class SearchPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             filetype_frame,
             text="File Types:",
-            font=FONTS["body"],
-            text_color=COLORS["text_primary"]
+            font=font_body,
+            text_color=text_primary
         ).pack(side="left", padx=(0, 10))
 
         self.file_type_var = ctk.StringVar(value="All")
         self.file_type_dropdown = ctk.CTkComboBox(
             filetype_frame,
             variable=self.file_type_var,
-            values=["All", "Documents (.docx, .pdf, .txt)", "Spreadsheets (.xlsx, .xls, .csv)", "Images (.png, .jpg, .jpeg, .gif)", "Archives (.zip, .rar, .7z)", "Custom..."],
+            values=list(_FILE_TYPE_VALUES),
             height=35,
-            font=FONTS["body"],
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"],
-            border_color=COLORS["primary"],
-            border_width=1
+            font=font_body,
+            fg_color=surface,
+            text_color=text_secondary,
+            border_color=primary,
+            border_width=1,
+            command=self._on_file_type_changed
         )
         self.file_type_dropdown.pack(side="left", fill="x", expand=True)
-        self.file_type_dropdown.bind("<<ComboboxSelected>>", self._on_file_type_changed)
 
-        # Custom file types entry (initially hidden)
-        self.custom_file_types_entry = ctk.CTkEntry(
-            filetype_frame,
-            placeholder_text=".docx .xlsx .pdf",
-            height=35,
-            font=FONTS["body"],
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"],
-            border_color=COLORS["primary"],
-            border_width=1
-        )
-        # Don't pack yet - will show when "Custom..." is selected
+        # Custom file types entry - built when "Custom..." is first selected
+        self._filetype_frame = filetype_frame
 
         # File size frame
         filesize_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -240,28 +264,23 @@ class SearchPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             filesize_frame,
             text="Size:",
-            font=FONTS["body"],
-            text_color=COLORS["text_primary"]
+            font=font_body,
+            text_color=text_primary
         ).pack(side="left", padx=(0, 10))
 
         # Min size
         ctk.CTkLabel(
             filesize_frame,
             text="Min:",
-            font=FONTS["small"],
-            text_color=COLORS["text_primary"]
+            font=font_small,
+            text_color=text_primary
         ).pack(side="left", padx=(5, 2))
 
         self.min_size_entry = ctk.CTkEntry(
             filesize_frame,
             placeholder_text="0",
             width=60,
-            height=35,
-            font=FONTS["body"],
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"],
-            border_color=COLORS["primary"],
-            border_width=1
+            **entry_kwargs
         )
         self.min_size_entry.pack(side="left", padx=(0, 5))
 
@@ -269,20 +288,15 @@ class SearchPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             filesize_frame,
             text="Max:",
-            font=FONTS["small"],
-            text_color=COLORS["text_primary"]
+            font=font_small,
+            text_color=text_primary
         ).pack(side="left", padx=(5, 2))
 
         self.max_size_entry = ctk.CTkEntry(
             filesize_frame,
             placeholder_text="999",
             width=60,
-            height=35,
-            font=FONTS["body"],
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"],
-            border_color=COLORS["primary"],
-            border_width=1
+            **entry_kwargs
         )
         self.max_size_entry.pack(side="left", padx=(0, 5))
 
@@ -291,13 +305,13 @@ class SearchPanel(ctk.CTkFrame):
         self.size_unit_dropdown = ctk.CTkComboBox(
             filesize_frame,
             variable=self.size_unit_var,
-            values=["KB", "MB", "GB"],
+            values=list(_SIZE_UNIT_VALUES),
             width=50,
             height=35,
-            font=FONTS["body"],
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"],
-            border_color=COLORS["primary"],
+            font=font_body,
+            fg_color=surface,
+            text_color=text_secondary,
+            border_color=primary,
             border_width=1
         )
         self.size_unit_dropdown.pack(side="left", padx=(0, 5))
@@ -306,25 +320,26 @@ class SearchPanel(ctk.CTkFrame):
         folder_label = ctk.CTkLabel(
             self,
             text="Folders:",
-            font=FONTS["small"],
-            text_color=COLORS["text_primary"]
+            font=font_small,
+            text_color=text_primary
         )
         folder_label.pack(padx=15, pady=(5, 2), anchor="w")
 
-        # Folder display (scrollable)
-        folder_frame = ctk.CTkFrame(self, fg_color=COLORS["surface"], border_width=1, border_color=COLORS["border"])
+        # Folder display (read-only label, one folder per line)
+        folder_frame = ctk.CTkFrame(self, fg_color=surface, border_width=1, border_color=border)
         folder_frame.pack(fill="x", padx=15, pady=2)
 
-        self.folder_text = ctk.CTkTextbox(
+        self.folder_text = ctk.CTkLabel(
             folder_frame,
-            height=60,
-            font=FONTS["small"],
-            wrap="word",
-            fg_color=COLORS["surface"],
-            text_color=COLORS["text_secondary"]
+            text="",
+            anchor="nw",
+            justify="left",
+            wraplength=400,
+            font=font_small,
+            fg_color=surface,
+            text_color=text_secondary
         )
         self.folder_text.pack(fill="both", expand=True, padx=5, pady=5)
-        self.folder_text.configure(state="disabled")
 
         # Update folder display
         self._update_folder_display()
@@ -338,9 +353,9 @@ class SearchPanel(ctk.CTkFrame):
             text="Browse",
             width=70,
             height=24,
-            font=FONTS["small"],
-            fg_color=COLORS["primary"],
-            text_color=COLORS["background"],
+            font=font_small,
+            fg_color=primary,
+            text_color=background,
             hover_color="#0000A8",
             command=self._browse_folder
         ).pack(side="left", padx=(0, 5))
@@ -350,11 +365,8 @@ class SearchPanel(ctk.CTkFrame):
             text="Clear All",
             width=70,
             height=24,
-            font=FONTS["small"],
-            fg_color=COLORS["accent"],
-            text_color=COLORS["background"],
-            hover_color="#E01670",
-            command=self._clear_folders
+            command=self._clear_folders,
+            **accent_btn_kwargs
         ).pack(side="left", padx=(0, 5))
 
         # Button container for search/cancel toggle
@@ -366,16 +378,88 @@ class SearchPanel(ctk.CTkFrame):
             self.button_container,
             text="Search",
             height=40,
-            font=FONTS["heading"],
-            fg_color=COLORS["primary"],
-            text_color=COLORS["background"],
+            font=font_heading,
+            fg_color=primary,
+            text_color=background,
             hover_color="#0000A8",
             command=self._on_search_clicked
         )
         self.search_button.pack(fill="x")
 
-        # Cancel button (hidden initially)
-        self.cancel_button = ctk.CTkButton(
+        # Inputs locked while a search runs (the date row adds its own when built)
+        self._input_widgets = (
+            self.keyword_entry,
+            self.case_sensitive_check,
+            self.date_filter_button,
+        )
+
+    def _show_date_filter(self):
+        """Replace the "Add date filter" button with the From/To date row."""
+        if self.start_date_entry is None:
+            self.date_filter_button.pack_forget()
+            self._build_date_row()
+
+    def _build_date_row(self):
+        """Create the From/To date entries and their Clear button."""
+        text_primary, font_small = COLORS["text_primary"], FONTS["small"]
+        date_entry_kwargs = {
+            "placeholder_text": "YYYY-MM-DD", "width": 95, "height": 25, "font": font_small,
+            "fg_color": COLORS["surface"], "text_color": COLORS["text_secondary"],
+            "border_color": COLORS["primary"], "border_width": 1,
+        }
+
+        # Start date
+        ctk.CTkLabel(
+            self._date_frame,
+            text="From:",
+            font=font_small,
+            text_color=text_primary
+        ).pack(side="left", padx=(5, 2))
+        self.start_date_entry = ctk.CTkEntry(self._date_frame, **date_entry_kwargs)
+        self.start_date_entry.pack(side="left", padx=(0, 5))
+
+        # End date
+        ctk.CTkLabel(
+            self._date_frame,
+            text="To:",
+            font=font_small,
+            text_color=text_primary
+        ).pack(side="left", padx=(5, 2))
+        self.end_date_entry = ctk.CTkEntry(self._date_frame, **date_entry_kwargs)
+        self.end_date_entry.pack(side="left", padx=(0, 5))
+
+        # Clear dates button
+        self.clear_dates_button = ctk.CTkButton(
+            self._date_frame,
+            text="Clear",
+            width=50,
+            height=25,
+            font=font_small,
+            fg_color=COLORS["accent"],
+            text_color=COLORS["background"],
+            hover_color="#E01670",
+            command=self._clear_dates
+        )
+        self.clear_dates_button.pack(side="left", padx=(2, 0))
+
+        self._input_widgets += (self.start_date_entry, self.end_date_entry, self.clear_dates_button)
+
+    def _build_custom_file_types_entry(self) -> ctk.CTkEntry:
+        """Create the custom file types entry (not packed)."""
+        return ctk.CTkEntry(
+            self._filetype_frame,
+            placeholder_text=".docx .xlsx .pdf",
+            height=35,
+            font=FONTS["body"],
+            fg_color=COLORS["surface"],
+            text_color=COLORS["text_secondary"],
+            border_color=COLORS["primary"],
+            border_width=1
+        )
+
+    def _build_cancel_button(self) -> ctk.CTkButton:
+        """Create the cancel search button (not packed)."""
+        return ctk.CTkButton(
             self.button_container,
             text="Cancel Search",
             height=40,
@@ -385,26 +469,22 @@ class SearchPanel(ctk.CTkFrame):
             hover_color="#E01670",
             command=self._on_cancel_clicked
         )
-        # Don't pack yet - will show when search starts
 
     def _update_folder_display(self):
         """Update folder display text."""
-        self.folder_text.configure(state="normal")
-        self.folder_text.delete("1.0", "end")
-
-        if self.search_folders:
-            for folder in self.search_folders:
-                self.folder_text.insert("end", f"{folder}\n")
-        else:
-            self.folder_text.insert("end", "No folders selected")
-
-        self.folder_text.configure(state="disabled")
+        current = tuple(self.search_folders)
+        if current == self._last_folder_render:
+            return
+        self._last_folder_render = current
+        self.folder_text.configure(text="\n".join(self.search_folders) or "No folders selected")
 
     def _browse_folder(self):
         """Open folder browser dialog."""
+        from tkinter import filedialog  # Deferred: only needed once the user browses
+
         folder = filedialog.askdirectory(title="Select folder to search")
         if folder and folder not in self.search_folders:
-            self.search_folders.append(folder)
+            self.search_folders[folder] = None
             self._update_folder_display()
             self.on_status(f"Added: {folder}")
 
@@ -420,54 +500,55 @@ class SearchPanel(ctk.CTkFrame):
         self.end_date_entry.delete(0, "end")
         self.on_status("Date filters cleared")
 
-    def _on_file_type_changed(self, event=None):
+    def _on_file_type_changed(self, choice=None):
         """Handle file type dropdown change."""
         selected = self.file_type_var.get()
         if selected == "Custom...":
             # Show custom file types entry
+            if self.custom_file_types_entry is None:
+                self.custom_file_types_entry = self._build_custom_file_types_entry()
             self.custom_file_types_entry.pack(side="left", fill="x", expand=True, padx=(5, 0))
-        else:
+        elif self.custom_file_types_entry is not None:
             # Hide custom file types entry
             self.custom_file_types_entry.pack_forget()
 
-    def _get_file_type_extensions(self) -> list:
+    def _get_file_type_extensions(self) -> Tuple[str, ...]:
         """Get file extensions based on selected file type."""
         selected = self.file_type_var.get()
+        custom_text = ""
+        if selected == "Custom..." and self.custom_file_types_entry is not None:
+            custom_text = self.custom_file_types_entry.get().strip()
 
-        type_map = {
-            "All": [],
-            "Documents (.docx, .pdf, .txt)": [".docx", ".pdf", ".txt", ".doc"],
-            "Spreadsheets (.xlsx, .xls, .csv)": [".xlsx", ".xls", ".csv", ".xlsm"],
-            "Images (.png, .jpg, .jpeg, .gif)": [".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff"],
-            "Archives (.zip, .rar, .7z)": [".zip", ".rar", ".7z", ".tar", ".gz"],
-        }
+        # Reuse the last result while the filter is unchanged
+        key = (selected, custom_text)
+        if key == self._ext_cache_key:
+            return self._ext_cache
 
-        if selected in type_map:
-            return type_map[selected]
-        elif selected == "Custom...":
-            # Parse custom extensions
-            custom_text = self.custom_file_types_entry.get().strip()
-            if custom_text:
-                # Split by space or comma
-                extensions = re.split(r'[,\s]+', custom_text)
-                # Ensure they start with dot
-                return ["." + ext.lstrip(".") if ext else "" for ext in extensions if ext]
-            return []
-        return []
+        if selected in _TYPE_MAP:
+            extensions = _TYPE_MAP[selected]
+        elif custom_text:
+            # Split by space or comma, ensure they start with dot
+            extensions = tuple("." + ext.lstrip(".") for ext in _CUSTOM_EXT_SPLIT_RE.split(custom_text) if ext)
+        else:
+            extensions = ()
+
+        self._ext_cache_key = key
+        self._ext_cache = extensions
+        return extensions
 
     def _parse_file_size(self, size_str: str, unit: str) -> Optional[int]:
-        """Parse file size string and convert to bytes."""
-        if not size_str.strip():
+        """Parse an already-stripped file size string and convert to bytes."""
+        if not size_str:
             return None
 
+        multiplier = _UNIT_MULT.get(unit, 1024 * 1024)
+        # Whole numbers (the common case) skip the float round-trip
+        if size_str.isdecimal():
+            return int(size_str) * multiplier
+
         try:
-            size_num = float(size_str.strip())
-            unit_multiplier = {
-                "KB": 1024,
-                "MB": 1024 * 1024,
-                "GB": 1024 * 1024 * 1024
-            }
-            return int(size_num * unit_multiplier.get(unit, 1024 * 1024))
+            size_num = float(size_str)
+            return int(size_num * multiplier)
         except ValueError:
             return None
 
@@ -476,29 +557,27 @@ class SearchPanel(ctk.CTkFrame):
         Validate date string format (YYYY-MM-DD).
 
         Args:
-            date_str: Date string to validate
+            date_str: Date string to validate (already stripped)
 
         Returns:
             True if valid or empty, False otherwise
         """
-        if not date_str.strip():
+        if not date_str:
             return True  # Empty is valid (no filter)
-
-        # Check format
-        pattern = r'^\d{4}-\d{2}-\d{2}$'
-        if not re.match(pattern, date_str):
-            return False
-
-        # Validate it's a real date
-        try:
-            datetime.strptime(date_str, '%Y-%m-%d')
-            return True
-        except ValueError:
-            return False
+        return _is_valid_date(date_str)
 
     def _on_search_clicked(self):
         """Handle search button click."""
+        # Read every entry and variable once up front
         keyword = self.keyword_entry.get().strip()
+        # No date row yet means no date filter
+        start_date = self.start_date_entry.get().strip() if self.start_date_entry is not None else ""
+        end_date = self.end_date_entry.get().strip() if self.end_date_entry is not None else ""
+        exclude_keywords = self.exclude_entry.get().strip()
+        min_size_text = self.min_size_entry.get().strip()
+        max_size_text = self.max_size_entry.get().strip()
+        size_unit = self.size_unit_var.get()
+        case_sensitive = self.case_sensitive_var.get()
 
         if not keyword:
             self.on_status("Please enter search keywords")
@@ -508,10 +587,7 @@ class SearchPanel(ctk.CTkFrame):
             self.on_status("Please select at least one folder")
             return
 
-        # Get and validate dates
-        start_date = self.start_date_entry.get().strip()
-        end_date = self.end_date_entry.get().strip()
-
+        # Validate dates
         if start_date and not self._validate_date(start_date):
             self.on_status("Invalid start date format (use YYYY-MM-DD)")
             return
@@ -520,35 +596,37 @@ class SearchPanel(ctk.CTkFrame):
             self.on_status("Invalid end date format (use YYYY-MM-DD)")
             return
 
-        # Get exclude keywords
-        exclude_keywords = self.exclude_entry.get().strip()
-        exclude_list = [kw.strip() for kw in exclude_keywords.split(",") if kw.strip()] if exclude_keywords else []
+        # Get and validate file size filters before building the other filters
+        min_size = self._parse_file_size(min_size_text, size_unit)
+        max_size = self._parse_file_size(max_size_text, size_unit)
 
-        # Get file type extensions
-        file_extensions = self._get_file_type_extensions()
-
-        # Get file size filters
-        min_size = self._parse_file_size(self.min_size_entry.get(), self.size_unit_var.get())
-        max_size = self._parse_file_size(self.max_size_entry.get(), self.size_unit_var.get())
-
-        # Validate size filters
         if min_size and max_size and min_size > max_size:
             self.on_status("Min size cannot be greater than max size")
             return
 
+        # Get exclude keywords
+        exclude_list = [s for kw in exclude_keywords.split(",") if (s := kw.strip())] if exclude_keywords else []
+
+        # Get file type extensions
+        file_extensions = self._get_file_type_extensions()
+
         # Pass all parameters
         self.on_search(
             keyword,
-            self.search_folders,
-            self.case_sensitive_var.get(),
-            start_date if start_date else None,
-            end_date if end_date else None,
+            list(self.search_folders),
+            case_sensitive,
+            start_date or None,
+            end_date or None,
             exclude_list,
             file_extensions,
             min_size,
             max_size
         )
 
+    def _on_return(self, event):
+        """Start a search when Return is pressed in the keyword entry."""
+        self._on_search_clicked()
+
     def _on_cancel_clicked(self):
         """Handle cancel button click."""
         self.on_cancel()
@@ -556,21 +634,18 @@ class SearchPanel(ctk.CTkFrame):
     def set_searching_state(self, is_searching: bool):
         """Toggle between search/cancel button visibility and disable inputs."""
         if is_searching:
+            if self.cancel_button is None:
+                self.cancel_button = self._build_cancel_button()
             self.search_button.pack_forget()
             self.cancel_button.pack(fill="x")
-            self.keyword_entry.configure(state="disabled")
-            self.case_sensitive_check.configure(state="disabled")
-            self.start_date_entry.configure(state="disabled")
-            self.end_date_entry.configure(state="disabled")
-            self.clear_dates_button.configure(state="disabled")
         else:
-            self.cancel_button.pack_forget()
+            if self.cancel_button is not None:
+                self.cancel_button.pack_forget()
             self.search_button.pack(fill="x")
-            self.keyword_entry.configure(state="normal")
-            self.case_sensitive_check.configure(state="normal")
-            self.start_date_entry.configure(state="normal")
-            self.end_date_entry.configure(state="normal")
-            self.clear_dates_button.configure(state="normal")
+
+        state = "disabled" if is_searching else "normal"
+        for widget in self._input_widgets:
+            widget.configure(state=state)
 
     def disable_search_button(self):
         """Disable search button during search (legacy method)."""
@@ -0,0 +1,30 @@
+"""Short-lived os.stat cache shared by the results panels."""
+
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+
+class StatCache:
+    """Stat results per path, trusted for ``ttl`` seconds before hitting the disk again."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Optional[os.stat_result]]] = {}  # path -> (taken at, stat)
+
+    def get(self, path: str) -> Optional[os.stat_result]:
+        """Stat a path, reusing results younger than the TTL (None if missing)."""
+        now = time.monotonic()
+        entry = self._entries.get(path)
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        self._entries[path] = (now, stat)
+        return stat
+
+    def clear(self):
+        """Forget every cached stat (e.g. when a new result set arrives)."""
+        self._entries.clear()
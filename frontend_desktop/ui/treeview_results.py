@@ -1,26 +1,81 @@
 """Results panel using native Tkinter Treeview for professional table display."""
 
 import csv
+import functools
 import os
 import subprocess
 import sys
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from tkinter import filedialog, ttk
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import customtkinter as ctk
 
 # Handle branding imports with fallback
 try:
     from ..branding import COLORS, FONTS
+    from .stat_cache import StatCache
 except ImportError:
     parent_dir = str(Path(__file__).parent.parent)
     if parent_dir not in sys.path:
         sys.path.insert(0, parent_dir)
     from branding import COLORS, FONTS
 
+    from ui.stat_cache import StatCache
+
+# Quick filter waits this long after the last keystroke before filtering
+FILTER_DEBOUNCE_MS = 150
+
+# Result count from which the quick filter scans NumPy string arrays (when available)
+NUMPY_FILTER_MIN_RESULTS = 50000
+
+# File stats backing the context menu and properties are reused for this many seconds
+STAT_CACHE_TTL = 2.0
+
+# Timestamp formats for file properties and default export filenames
+TS_FMT = "%Y-%m-%d %H:%M:%S"
+FNAME_FMT = "%Y-%m-%d_%H%M%S"
+
+# Write buffer for CSV exports (bytes)
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Rows moved per mouse-wheel notch
+WHEEL_ROWS = 3
+
+# (heading height, row height) in pixels until a rendered row can be measured
+# (the row height is replaced by the theme's Treeview rowheight when it sets one)
+DEFAULT_ROW_GEOMETRY = (25, 20)
+
+# Tcl helper that inserts a flat {iid tag values ...} list of rows in one call.
+# Rows cross into Tcl as list objects, so values need no quoting or escaping.
+_INSERT_ROWS_PROC = "::treeview_results_insert_rows"
+_INSERT_ROWS_SCRIPT = (
+    "proc " + _INSERT_ROWS_PROC + " {tree rows} {\n"
+    "    foreach {iid tag values} $rows {\n"
+    "        $tree insert {} end -id $iid -values $values -tags [list $tag]\n"
+    "    }\n"
+    "}"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _numpy_strings():
+    """
+    Import NumPy for the large-result quick filter on first use.
+
+    Returns the numpy module, or None without NumPy 2 (string ufuncs and
+    StringDType); the filter then falls back to a Python scan.
+    """
+    try:
+        import numpy as np
+        from numpy import strings  # noqa: F401  (NumPy 2 only)
+    except ImportError:
+        return None
+    return np
+
 
 class TreeviewResultsPanel(ctk.CTkFrame):
     """Professional results table using Tkinter Treeview with sorting and filtering."""
@@ -36,6 +91,29 @@ class TreeviewResultsPanel(ctk.CTkFrame):
         self.quick_filter_text: str = ""
         self.is_cached: bool = False
 
+        # The tree only holds the rows in view; _order is the full display order
+        self._order: List[int] = []  # Indices into results, sorted and filtered
+        self._display_rows: List[tuple] = []  # Column values per result, aligned with results
+        self._top: int = 0  # Index in _order of the first rendered row
+        self._visible_rows: int = 20  # Rows that fit the tree (updated on resize)
+        self._row_geometry = DEFAULT_ROW_GEOMETRY
+        self._row_measured: bool = False  # _row_geometry comes from a rendered row
+        self._selected_pos: Optional[int] = None  # Index in _order of the selected row
+        self._filter_after_id: Optional[str] = None  # Pending debounced filter callback
+        self._lc_index: List[tuple] = []  # (filename.lower(), path.lower(), index) built once per result set
+        self._lc_arrays = None  # (filenames, paths) as NumPy string arrays, built on the first large filter
+        self._filtered_idx: Sequence[int] = ()  # Indices into results that pass the quick filter
+        self._filter_query: str = ""  # Query _filtered_idx was computed for
+        self._sorted_orders: Dict[str, List[int]] = {}  # Ascending _filtered_idx order per column
+        self._sort_keys: Dict[str, list] = {}  # Per-column sort keys aligned with results, built on first sort
+        self._stat_cache = StatCache(STAT_CACHE_TTL)
+        # Single worker so exports run off the UI thread, one at a time (created on first export)
+        self._export_pool: Optional[ThreadPoolExecutor] = None
+        self._export_running: bool = False  # An export is writing on the export pool
+        self._context_menu: Optional[tk.Menu] = None  # Row menu, built on first right-click
+        self._export_menu: Optional[tk.Menu] = None  # Export format menu, built on first use
+        self._ctx_target: Tuple[str, str] = ("", "")  # (filename, path) the context menu acts on
+
         self._build_ui()
 
     def _build_ui(self):
@@ -126,6 +204,7 @@ class TreeviewResultsPanel(ctk.CTkFrame):
 
         # Configure Treeview style
         self._configure_treeview_style()
+        self._row_geometry = (DEFAULT_ROW_GEOMETRY[0], self._style_row_height())
 
         # Configure columns based on result type
         if self.result_type == "organizer":
@@ -153,6 +232,11 @@ class TreeviewResultsPanel(ctk.CTkFrame):
             show="headings",
             style="Treeview"
         )
+        self.tree.tk.eval(_INSERT_ROWS_SCRIPT)
+
+        # Configure row striping (rows carry their tag from the batched insert)
+        self.tree.tag_configure("oddrow", background=COLORS["surface"])
+        self.tree.tag_configure("evenrow", background="#F0F0F5")
 
         # Define columns and headings
         for col in columns:
@@ -160,14 +244,14 @@ class TreeviewResultsPanel(ctk.CTkFrame):
             self.tree.column(col, width=config["width"], anchor=config["anchor"], minwidth=80)
             self.tree.heading(col, text=config["text"], command=lambda c=col: self._sort_by_column(c))
 
-        # Add scrollbars
-        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        # Add scrollbars; the vertical one scrolls the row window, not the tree
+        self._vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self._on_vscroll)
         hsb = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(xscrollcommand=hsb.set)
 
         # Grid layout
         self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
+        self._vsb.grid(row=0, column=1, sticky="ns")
         hsb.grid(row=1, column=0, sticky="ew")
 
         table_frame.grid_rowconfigure(0, weight=1)
@@ -176,6 +260,17 @@ class TreeviewResultsPanel(ctk.CTkFrame):
         # Bind right-click for context menu
         self.tree.bind("<Button-3>", self._show_context_menu)
         self.tree.bind("<Button-1>", self._on_row_select)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+
+        # Scrolling and resizing move or resize the rendered row window
+        self.tree.bind("<Configure>", self._on_tree_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", self._on_mousewheel)
+        self.tree.bind("<Button-5>", self._on_mousewheel)
+        self.tree.bind("<Up>", self._on_key_up)
+        self.tree.bind("<Down>", self._on_key_down)
+        self.tree.bind("<Prior>", self._on_page_up)
+        self.tree.bind("<Next>", self._on_page_down)
 
     def _configure_treeview_style(self):
         """Configure Treeview colors with strong contrast."""
@@ -215,9 +310,13 @@ class TreeviewResultsPanel(ctk.CTkFrame):
             foreground=[("selected", "#FFFFFF")]   # White text when selected
         )
 
-        # Configure row striping
-        style.configure("oddrow", background=COLORS["surface"], font=("Arial", 10))
-        style.configure("evenrow", background="#F0F0F5", font=("Arial", 10))
+    @staticmethod
+    def _style_row_height() -> int:
+        """Row height the ttk theme gives Treeview rows (DPI-scaled), or the default."""
+        try:
+            return int(ttk.Style().lookup("Treeview", "rowheight"))
+        except (ValueError, tk.TclError):
+            return DEFAULT_ROW_GEOMETRY[1]
 
     def _sort_by_column(self, column: str):
         """Sort results by clicking column header."""
@@ -233,25 +332,70 @@ class TreeviewResultsPanel(ctk.CTkFrame):
             self._refresh_display()
 
     def _on_quick_filter_change(self, event=None):
-        """Filter results as user types."""
-        self.quick_filter_text = self.quick_filter_entry.get().strip().lower()
-
-        if self.quick_filter_text:
-            self.filtered_results = [
-                r for r in self.results
-                if self.quick_filter_text in r.get("filename", "").lower()
-                   or self.quick_filter_text in r.get("path", "").lower()
-            ]
+        """Filter results as user types (debounced)."""
+        self._cancel_pending_filter()
+        self._filter_after_id = self.after(FILTER_DEBOUNCE_MS, self._apply_quick_filter)
+
+    def _cancel_pending_filter(self):
+        """Drop a scheduled filter pass, if any."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
+    def _apply_quick_filter(self):
+        """Apply the quick filter once typing has paused."""
+        self._filter_after_id = None
+        query = self.quick_filter_entry.get().strip().lower()
+        if query == self.quick_filter_text:
+            # Arrow keys, modifiers and whitespace edits leave the filter as it was
+            return
+        self.quick_filter_text = query
+
+        narrowing = bool(self._filter_query) and query.startswith(self._filter_query)
+        use_numpy = len(self._filtered_idx) >= NUMPY_FILTER_MIN_RESULTS and _numpy_strings() is not None
+        if query:
+            if narrowing and not use_numpy:
+                # Extending the last query can only drop rows, so rescan just the current matches
+                lc_index = self._lc_index
+                self._filtered_idx = [
+                    i for i in self._filtered_idx if query in lc_index[i][0] or query in lc_index[i][1]
+                ]
+            elif len(self._lc_index) >= NUMPY_FILTER_MIN_RESULTS and _numpy_strings() is not None:
+                self._filtered_idx = self._numpy_filter(query)
+            else:
+                self._filtered_idx = [i for fn, pt, i in self._lc_index if query in fn or query in pt]
+            self.filtered_results = [self.results[i] for i in self._filtered_idx]
         else:
+            self._filtered_idx = range(len(self.results))
             self.filtered_results = self.results
+        self._filter_query = query
+        self._sorted_orders = {}
 
         if self.results:
             self._refresh_display()
 
+    def _numpy_filter(self, query: str) -> List[int]:
+        """Indices of results whose lowercased filename or path contains query, scanned in C."""
+        np = _numpy_strings()
+        if self._lc_arrays is None:
+            # Built once per result set; variable-width strings avoid padding every path to the longest
+            string_dtype = np.dtypes.StringDType()
+            self._lc_arrays = (
+                np.array([fn for fn, _, _ in self._lc_index], dtype=string_dtype),
+                np.array([pt for _, pt, _ in self._lc_index], dtype=string_dtype),
+            )
+        filenames, paths = self._lc_arrays
+        mask = (np.strings.find(filenames, query) >= 0) | (np.strings.find(paths, query) >= 0)
+        return np.flatnonzero(mask).tolist()
+
     def _clear_quick_filter(self):
         """Clear filter and show all results."""
+        self._cancel_pending_filter()
         self.quick_filter_entry.delete(0, "end")
         self.quick_filter_text = ""
+        self._filter_query = ""
+        self._filtered_idx = range(len(self.results))
+        self._sorted_orders = {}
         self.filtered_results = self.results
 
         if self.results:
@@ -261,38 +405,16 @@ class TreeviewResultsPanel(ctk.CTkFrame):
 
     def _refresh_display(self):
         """Refresh Treeview with current results."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Sort results
-        sorted_results = sorted(
-            self.filtered_results,
-            key=lambda x: x.get(self.sort_column, "").lower() if isinstance(x.get(self.sort_column), str) else x.get(self.sort_column, 0),
-            reverse=not self.sort_ascending
-        )
-
-        # Add sorted results to tree
-        for i, file_info in enumerate(sorted_results):
-            # Format values based on result type
-            if self.result_type == "organizer":
-                values = (
-                    file_info.get("filename", ""),
-                    file_info.get("cluster_id", ""),
-                    file_info.get("cluster_name", ""),
-                    file_info.get("top_terms", "")
-                )
-            else:  # Default: search results
-                values = (
-                    file_info.get("filename", ""),
-                    file_info.get("path", ""),
-                    file_info.get("modified", "")[:10],  # Just date part
-                    file_info.get("type", "")
-                )
-
-            # Alternate row colors for readability
-            tag = "oddrow" if i % 2 == 0 else "evenrow"
-            self.tree.insert("", "end", values=values, tags=(tag,))
+        # Sort result indices by the precomputed column keys; flipping direction reuses the sort
+        order = self._sorted_orders.get(self.sort_column)
+        if order is None:
+            keys = self._sort_keys_for(self.sort_column)
+            order = sorted(self._filtered_idx, key=keys.__getitem__)
+            self._sorted_orders[self.sort_column] = order
+        self._order = order if self.sort_ascending else order[::-1]
+        self._top = 0
+        self._selected_pos = None
+        self._render_window()
 
         # Update counts
         if self.quick_filter_text:
@@ -306,13 +428,166 @@ class TreeviewResultsPanel(ctk.CTkFrame):
         else:
             self.cache_label.configure(text="🔍 Live search")
 
+    def _sort_keys_for(self, column: str) -> list:
+        """Sort keys for a column, aligned with results (strings compare case-insensitively)."""
+        keys = self._sort_keys.get(column)
+        if keys is None:
+            keys = []
+            for r in self.results:
+                value = r.get(column, 0)
+                keys.append(value.lower() if isinstance(value, str) else value)
+            self._sort_keys[column] = keys
+        return keys
+
+    def _row_values(self, file_info: Dict[str, Any]) -> tuple:
+        """Format a result's column values based on result type."""
+        if self.result_type == "organizer":
+            return (
+                file_info.get("filename", ""),
+                file_info.get("cluster_id", ""),
+                file_info.get("cluster_name", ""),
+                file_info.get("top_terms", "")
+            )
+        # Default: search results
+        return (
+            file_info.get("filename", ""),
+            file_info.get("path", ""),
+            file_info.get("modified", "")[:10],  # Just date part
+            file_info.get("type", "")
+        )
+
+    def _render_window(self):
+        """Show the rows of _order that fit the tree, starting at _top."""
+        total = len(self._order)
+        self._top = max(0, min(self._top, total - self._visible_rows))
+        top = self._top
+        end = min(total, top + self._visible_rows)
+
+        # Clear existing items in one call
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+
+        # Row iids are positions in _order; stripes follow position so they hold while scrolling.
+        # All rows go to Tcl in a single call.
+        order = self._order
+        display_rows = self._display_rows
+        rows = []
+        for pos in range(top, end):
+            rows += (str(pos), "oddrow" if pos % 2 == 0 else "evenrow", display_rows[order[pos]])
+        if rows:
+            self.tree.tk.call(_INSERT_ROWS_PROC, str(self.tree), tuple(rows))
+            if not self._row_measured:
+                # <Configure> ran before any row existed; size the window from a real row once laid out
+                self.after_idle(self._remeasure_rows)
+
+        if self._selected_pos is not None and top <= self._selected_pos < end:
+            self.tree.selection_set(str(self._selected_pos))
+
+        # Scrollbar reflects the window's place in the full list
+        if total:
+            self._vsb.set(top / total, end / total)
+        else:
+            self._vsb.set(0.0, 1.0)
+
+    def _rows_that_fit(self, height: int) -> int:
+        """Number of rows the tree can show at the given pixel height."""
+        children = self.tree.get_children()
+        bbox = self.tree.bbox(children[0]) if children else ""
+        if bbox:
+            self._row_geometry = (bbox[1], bbox[3])
+            self._row_measured = True
+        heading, row_height = self._row_geometry
+        return max(1, (height - heading) // max(1, row_height))
+
+    def _on_tree_configure(self, event):
+        """Resize the row window to the tree's new height."""
+        self._fit_rows(event.height)
+
+    def _remeasure_rows(self):
+        """Re-fit the row window once a rendered row can be measured."""
+        if not self._row_measured and self.tree.winfo_ismapped():
+            self._fit_rows(self.tree.winfo_height())
+
+    def _fit_rows(self, height: int):
+        """Show as many rows as fit the height; _render_window keeps the last row reachable."""
+        rows = self._rows_that_fit(height)
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._render_window()
+
+    def _scroll_to(self, top: int):
+        """Move the row window so that row `top` is first."""
+        if self._order:
+            self._top = top
+            self._render_window()
+
+    def _on_vscroll(self, action, amount, unit=None):
+        """Scrollbar command: position the row window in the full list."""
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self._order)))
+        elif action == "scroll":
+            step = self._visible_rows if unit == "pages" else 1
+            self._scroll_to(self._top + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        """Scroll the row window with the mouse wheel."""
+        if event.num == 5 or event.delta < 0:
+            self._scroll_to(self._top + WHEEL_ROWS)
+        elif event.num == 4 or event.delta > 0:
+            self._scroll_to(self._top - WHEEL_ROWS)
+        return "break"
+
+    def _move_selection(self, delta: int):
+        """Move the selection by delta rows, scrolling the window to keep it visible."""
+        if self._selected_pos is None or not self._order:
+            return None
+        pos = max(0, min(len(self._order) - 1, self._selected_pos + delta))
+        self._selected_pos = pos
+        if pos < self._top:
+            self._top = pos
+        elif pos >= self._top + self._visible_rows:
+            self._top = pos - self._visible_rows + 1
+        self._render_window()
+        self.tree.focus(str(pos))
+        return "break"
+
+    def _on_key_up(self, event):
+        """Select the previous row."""
+        return self._move_selection(-1)
+
+    def _on_key_down(self, event):
+        """Select the next row."""
+        return self._move_selection(1)
+
+    def _on_page_up(self, event):
+        """Select the row one page up."""
+        return self._move_selection(-self._visible_rows)
+
+    def _on_page_down(self, event):
+        """Select the row one page down."""
+        return self._move_selection(self._visible_rows)
+
+    def _on_tree_select(self, event):
+        """Remember the selected row's position so it survives re-rendering."""
+        selection = self.tree.selection()
+        if selection:
+            self._selected_pos = int(selection[0])
+
     def _on_row_select(self, event):
         """Handle row selection."""
         selection = self.tree.selection()
         if selection:
-            item = selection[0]
-            values = self.tree.item(item)["values"]
-            self.on_status(f"Selected: {values[0]}")
+            record = self._record_for(selection[0])
+            if record is not None:
+                self.on_status(f"Selected: {record.get('filename', '')}")
+
+    def _record_for(self, iid: str) -> Optional[Dict[str, Any]]:
+        """Result record behind a rendered row (iids are positions in _order)."""
+        try:
+            return self.results[self._order[int(iid)]]
+        except (ValueError, IndexError):
+            return None
 
     def _show_context_menu(self, event):
         """Show right-click context menu."""
@@ -320,20 +595,30 @@ class TreeviewResultsPanel(ctk.CTkFrame):
         if not item:
             return
 
-        item = item[0]
-        values = self.tree.item(item)["values"]
-
-        if len(values) < 2:
+        record = self._record_for(item[0])
+        if record is None:
             return
 
-        filename = values[0]
-        filepath = values[1]
+        # Organizer results carry the file's location as original_path
+        filename = record.get("filename", "")
+        filepath = record.get("path") or record.get("original_path", "")
+        if not filepath:
+            return
 
-        if not os.path.exists(filepath):
+        if self._stat_cache.get(filepath) is None:
             self.on_status("File no longer exists")
             return
 
-        # Create context menu
+        self._ctx_target = (filename, filepath)
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        try:
+            self._context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self._context_menu.grab_release()
+
+    def _build_context_menu(self) -> tk.Menu:
+        """Create the row context menu once; its commands act on _ctx_target."""
         context_menu = tk.Menu(
             self.tree,
             tearoff=False,
@@ -345,31 +630,27 @@ class TreeviewResultsPanel(ctk.CTkFrame):
 
         context_menu.add_command(
             label="📋 Copy Full Path",
-            command=lambda: self._copy_to_clipboard(filepath)
+            command=lambda: self._copy_to_clipboard(self._ctx_target[1])
         )
         context_menu.add_command(
             label="📄 Copy Filename",
-            command=lambda: self._copy_to_clipboard(filename)
+            command=lambda: self._copy_to_clipboard(self._ctx_target[0])
         )
         context_menu.add_separator()
         context_menu.add_command(
             label="📂 Open File Location",
-            command=lambda: self._open_folder(filepath)
+            command=lambda: self._open_folder(self._ctx_target[1])
         )
         context_menu.add_command(
             label="▶️ Open File",
-            command=lambda: self._open_file(filepath)
+            command=lambda: self._open_file(self._ctx_target[1])
         )
         context_menu.add_separator()
         context_menu.add_command(
             label="ℹ️ File Properties",
-            command=lambda: self._show_file_info(filepath)
+            command=lambda: self._show_file_info(self._ctx_target[1])
         )
-
-        try:
-            context_menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            context_menu.grab_release()
+        return context_menu
 
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard."""
@@ -407,10 +688,12 @@ class TreeviewResultsPanel(ctk.CTkFrame):
     def _show_file_info(self, filepath: str):
         """Show file properties in status."""
         try:
-            stat = os.stat(filepath)
+            stat = self._stat_cache.get(filepath)
+            if stat is None:
+                self.on_status(f"File not found: {filepath}")
+                return
             size_mb = stat.st_size / (1024 * 1024)
-            from datetime import datetime
-            mod_time = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+            mod_time = datetime.fromtimestamp(stat.st_mtime).strftime(TS_FMT)
 
             info = f"File: {Path(filepath).name} | Size: {size_mb:.2f} MB | Modified: {mod_time}"
             self.on_status(info)
@@ -423,12 +706,25 @@ class TreeviewResultsPanel(ctk.CTkFrame):
         self.filtered_results = results
         self.is_cached = is_cached
 
+        # Lowercase the filterable columns once instead of on every keystroke
+        self._lc_index = [
+            ((r.get("filename") or "").lower(), (r.get("path") or "").lower(), i) for i, r in enumerate(results)
+        ]
+        self._lc_arrays = None
+        self._display_rows = list(map(self._row_values, results))
+        self._filtered_idx = range(len(results))
+        self._filter_query = ""
+        self._sorted_orders = {}
+        self._sort_keys = {}
+        self._stat_cache.clear()
+
         # Clear filter
+        self._cancel_pending_filter()
         self.quick_filter_entry.delete(0, "end")
         self.quick_filter_text = ""
 
-        # Enable export button if results exist
-        if results:
+        # Enable export button if results exist (and no export is still writing)
+        if results and not self._export_running:
             self.export_button.configure(state="normal")
         else:
             self.export_button.configure(state="disabled")
@@ -439,11 +735,14 @@ class TreeviewResultsPanel(ctk.CTkFrame):
     def display_analysis_result(self, result: str):
         """Display AI analysis result as text."""
         # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._order = []
+        self._selected_pos = None
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
 
         # Add analysis text to a single cell
-        self.tree.insert("", "end", values=(result, "", "", ""))
+        self.tree.insert("", "end", iid="0", values=(result, "", "", ""))
         self.title_label.configure(text="Analysis Results")
         self.count_label.configure(text=f"{result.count(chr(10))} lines")
 
@@ -453,6 +752,18 @@ class TreeviewResultsPanel(ctk.CTkFrame):
             self.on_status("No results to export")
             return
 
+        if self._export_menu is None:
+            self._export_menu = self._build_export_menu()
+        try:
+            self._export_menu.tk_popup(
+                self.export_button.winfo_rootx(),
+                self.export_button.winfo_rooty() + self.export_button.winfo_height()
+            )
+        finally:
+            self._export_menu.grab_release()
+
+    def _build_export_menu(self) -> tk.Menu:
+        """Create the export format menu once."""
         export_menu = tk.Menu(
             self.export_button,
             tearoff=False,
@@ -470,14 +781,7 @@ class TreeviewResultsPanel(ctk.CTkFrame):
             label="📈 Export to Excel",
             command=self._export_to_excel
         )
-
-        try:
-            export_menu.tk_popup(
-                self.export_button.winfo_rootx(),
-                self.export_button.winfo_rooty() + self.export_button.winfo_height()
-            )
-        finally:
-            export_menu.grab_release()
+        return export_menu
 
     def _export_to_csv(self):
         """Export results to CSV file."""
@@ -486,7 +790,7 @@ class TreeviewResultsPanel(ctk.CTkFrame):
             return
 
         # Generate default filename with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        timestamp = datetime.now().strftime(FNAME_FMT)
         default_filename = f"search_results_{timestamp}.csv"
 
         # Show save dialog
@@ -499,28 +803,21 @@ class TreeviewResultsPanel(ctk.CTkFrame):
         if not file_path:
             return
 
-        try:
-            # Prepare data: use filtered results if filter is active, else all results
-            export_data = self.filtered_results if self.quick_filter_text else self.results
-
-            # Write CSV
-            with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                fieldnames = ["Filename", "Path", "Modified", "Type"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-                for result in export_data:
-                    writer.writerow({
-                        "Filename": result.get("filename", ""),
-                        "Path": result.get("path", ""),
-                        "Modified": result.get("modified", ""),
-                        "Type": result.get("type", "")
-                    })
-
-            self.on_status(f"✓ Exported {len(export_data)} results to CSV: {Path(file_path).name}")
-
-        except Exception as e:
-            self.on_status(f"Export error: {e}")
+        # Prepare data: use filtered results if filter is active, else all results
+        export_data = self.filtered_results if self.quick_filter_text else self.results
+        self._start_export(self._write_csv, file_path, list(export_data), "CSV")
+
+    @staticmethod
+    def _write_csv(file_path: str, export_data: List[Dict[str, Any]]):
+        """Write export rows to a CSV file (runs on the export pool)."""
+        # Stream rows as tuples through a large buffer
+        with open(file_path, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["Filename", "Path", "Modified", "Type"])
+            writer.writerows(
+                (r.get("filename", ""), r.get("path", ""), r.get("modified", ""), r.get("type", ""))
+                for r in export_data
+            )
 
     def _export_to_excel(self):
         """Export results to Excel file."""
@@ -529,15 +826,14 @@ class TreeviewResultsPanel(ctk.CTkFrame):
             return
 
         try:
-            import openpyxl
-            from openpyxl.styles import Font, PatternFill
+            import openpyxl  # noqa: F401
         except ImportError:
             self.on_status("Excel export requires openpyxl. Using CSV instead.")
             self._export_to_csv()
             return
 
         # Generate default filename with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        timestamp = datetime.now().strftime(FNAME_FMT)
         default_filename = f"search_results_{timestamp}.xlsx"
 
         # Show save dialog
@@ -550,57 +846,93 @@ class TreeviewResultsPanel(ctk.CTkFrame):
         if not file_path:
             return
 
+        # Prepare data: use filtered results if filter is active, else all results
+        export_data = self.filtered_results if self.quick_filter_text else self.results
+        self._start_export(self._write_excel, file_path, list(export_data), "Excel")
+
+    @staticmethod
+    def _write_excel(file_path: str, export_data: List[Dict[str, Any]]):
+        """Write export rows to an Excel workbook (runs on the export pool)."""
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill
+
+        # Write-only workbook streams rows to disk instead of holding every cell
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Search Results")
+
+        # Column widths must be set before the first row is written
+        ws.column_dimensions["A"].width = 30
+        ws.column_dimensions["B"].width = 50
+        ws.column_dimensions["C"].width = 20
+        ws.column_dimensions["D"].width = 12
+
+        # Write header with formatting
+        header_fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+        header_font = Font(color="FFFFFF", bold=True)
+        header = []
+        for title in ("Filename", "Path", "Modified", "Type"):
+            cell = WriteOnlyCell(ws, value=title)
+            cell.fill = header_fill
+            cell.font = header_font
+            header.append(cell)
+        ws.append(header)
+
+        # Write data
+        for r in export_data:
+            ws.append((r.get("filename", ""), r.get("path", ""), r.get("modified", ""), r.get("type", "")))
+
+        wb.save(file_path)
+
+    def _start_export(self, writer: Callable, file_path: str, export_data: List[Dict[str, Any]], label: str):
+        """Run an export writer on the export pool, keeping the button disabled until it finishes."""
+        self._export_running = True
+        self.export_button.configure(state="disabled")
+        self.on_status(f"Exporting {len(export_data)} results to {label}...")
+        if self._export_pool is None:
+            self._export_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="results-export")
+        future = self._export_pool.submit(writer, file_path, export_data)
+        future.add_done_callback(lambda f: self.after(0, self._export_done, f, file_path, len(export_data), label))
+
+    def _export_done(self, future: Future, file_path: str, count: int, label: str):
+        """Report a finished export on the UI thread."""
+        self._export_running = False
+        if self.results:
+            self.export_button.configure(state="normal")
         try:
-            # Prepare data: use filtered results if filter is active, else all results
-            export_data = self.filtered_results if self.quick_filter_text else self.results
-
-            # Create workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Search Results"
-
-            # Write header with formatting
-            headers = ["Filename", "Path", "Modified", "Type"]
-            ws.append(headers)
-
-            # Format header row
-            header_fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-            header_font = Font(color="FFFFFF", bold=True)
-
-            for cell in ws[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-
-            # Write data
-            for result in export_data:
-                ws.append([
-                    result.get("filename", ""),
-                    result.get("path", ""),
-                    result.get("modified", ""),
-                    result.get("type", "")
-                ])
-
-            # Adjust column widths
-            ws.column_dimensions["A"].width = 30
-            ws.column_dimensions["B"].width = 50
-            ws.column_dimensions["C"].width = 20
-            ws.column_dimensions["D"].width = 12
-
-            # Save workbook
-            wb.save(file_path)
-            self.on_status(f"✓ Exported {len(export_data)} results to Excel: {Path(file_path).name}")
-
+            future.result()
         except Exception as e:
             self.on_status(f"Export error: {e}")
+            return
+        self.on_status(f"✓ Exported {count} results to {label}: {Path(file_path).name}")
 
     def clear_results(self):
         """Clear all results."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._order = []
+        self._top = 0
+        self._selected_pos = None
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._vsb.set(0.0, 1.0)
 
         self.count_label.configure(text="")
         self.cache_label.configure(text="")
         self.title_label.configure(text="Results")
         self.results = []
         self.filtered_results = []
+        self._lc_index = []
+        self._lc_arrays = None
+        self._display_rows = []
+        self._filtered_idx = ()
+        self._filter_query = ""
+        self._sorted_orders = {}
+        self._sort_keys = {}
+        self._stat_cache.clear()
         self.export_button.configure(state="disabled")
+
+    def destroy(self):
+        """Stop the export worker along with the panel."""
+        if self._export_pool is not None:
+            self._export_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
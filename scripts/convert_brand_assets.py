@@ -6,6 +6,8 @@ This script converts Ayesa brand assets into the formats needed for the desktop
 
 Requirements:
 - Pillow (PIL) - already installed in the venv
+- Optional: Pillow-SIMD (pip uninstall pillow && pip install pillow-simd) is a
+  drop-in replacement whose SIMD LANCZOS kernels speed up the resizes below
 
 Conversions performed:
 1. Logo PNG (192x192) → Multiple sizes (16, 32, 64, 128, 256, 512px)
@@ -16,25 +18,33 @@ Conversions performed:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path to import PIL
 try:
     from PIL import Image
-    print("✓ Pillow (PIL) available")
+    from PIL import __version__ as PIL_VERSION
+    # Pillow-SIMD releases carry a ".postN" version suffix
+    print(f"✓ Pillow (PIL) {PIL_VERSION} available{' (SIMD build)' if '.post' in PIL_VERSION else ''}")
 except ImportError:
     print("✗ Pillow not installed. Install with: pip install Pillow")
     sys.exit(1)
 
+SOURCE_LOGO = Path(".github/idVZeT5U0c_logos.png")
+
+# zlib effort for generated header PNGs (optimize=True means level 9 plus extra passes)
+PNG_COMPRESS_LEVEL = 6
+
 
 def ensure_directories():
     """Create necessary asset directories."""
+    # Leaf directories only; mkdir(parents=True) creates assets/ and frontend_desktop/assets/ on the way
     dirs = [
-        "assets",
         "assets/icons",
         "assets/headers",
         "assets/logos",
-        "frontend_desktop/assets",
         "frontend_desktop/assets/icons",
     ]
 
@@ -43,29 +53,66 @@ def ensure_directories():
         print(f"✓ Created directory: {dir_path}")
 
 
+def verify_codecs():
+    """Report whether Pillow's JPEG codec is the SIMD-accelerated libjpeg-turbo."""
+    from PIL import features
+
+    if features.check_feature("libjpeg_turbo"):
+        print("✓ JPEG codec: libjpeg-turbo")
+    else:
+        print("⚠ JPEG codec is not libjpeg-turbo; header decoding will be slower")
+        print("  Install a Pillow wheel built against libjpeg-turbo (the official wheels are)")
+
+
+@lru_cache(maxsize=1)
+def _load_logo():
+    """Decode the source logo once; the logo, ICO and color steps share it read-only."""
+    with Image.open(SOURCE_LOGO) as img:
+        img.load()  # Pixels stay in memory after the file is closed
+    return img
+
+
+@lru_cache(maxsize=None)
+def _logo_variant(size):
+    """LANCZOS-resized logo at size x size, shared by the PNG and ICO steps."""
+    return _load_logo().resize((size, size), Image.Resampling.LANCZOS)
+
+
+def _save_logo_variant(size, output):
+    """Save one logo size as PNG (runs on a worker thread)."""
+    _logo_variant(size).save(output, "PNG")
+    return output
+
+
+def _resize_and_save(img, size, output, **save_options):
+    """LANCZOS-resize img to size and save it as PNG (Pillow releases the GIL for both)."""
+    img.resize(size, Image.Resampling.LANCZOS).save(output, "PNG", **save_options)
+    return output
+
+
 def convert_logo_png():
     """Convert PNG logo to multiple sizes."""
-    source = Path(".github/idVZeT5U0c_logos.png")
+    source = SOURCE_LOGO
 
     if not source.exists():
         print(f"✗ Logo not found: {source}")
         return False
 
     try:
-        img = Image.open(source)
+        img = _load_logo()
         print(f"✓ Loaded logo: {source} ({img.size})")
 
         # Generate multiple sizes
         sizes = [16, 32, 64, 128, 256, 512]
 
-        for size in sizes:
-            # Resize with high quality
-            resized = img.resize((size, size), Image.Resampling.LANCZOS)
-
-            # Save as PNG
-            output = Path(f"assets/icons/ayesa_logo_{size}x{size}.png")
-            resized.save(output, "PNG", quality=95)
-            print(f"  ✓ {size}x{size}: {output}")
+        # Resize with high quality and save as PNG; sizes are independent, so run them in parallel
+        with ThreadPoolExecutor(max_workers=min(len(sizes), os.cpu_count() or 1)) as pool:
+            futures = [
+                pool.submit(_save_logo_variant, size, Path(f"assets/icons/ayesa_logo_{size}x{size}.png"))
+                for size in sizes
+            ]
+            for size, future in zip(sizes, futures, strict=True):
+                print(f"  ✓ {size}x{size}: {future.result()}")
 
         return True
 
@@ -76,7 +123,7 @@ def convert_logo_png():
 
 def create_ico_file():
     """Create Windows ICO file from logo."""
-    source = Path(".github/idVZeT5U0c_logos.png")
+    source = SOURCE_LOGO
     output = Path("assets/icons/ayesa_logo.ico")
 
     if not source.exists():
@@ -84,23 +131,19 @@ def create_ico_file():
         return False
 
     try:
-        img = Image.open(source)
-
         # Create multiple sizes for ICO (standard Windows icon sizes)
         icon_sizes = [(16, 16), (32, 32), (64, 64), (128, 128), (256, 256)]
 
-        # Resize all variants
-        icon_images = []
-        for size in icon_sizes:
-            resized = img.resize(size, Image.Resampling.LANCZOS)
-            icon_images.append(resized)
+        # Reuse the variants convert_logo_png already resized, largest first: the ICO
+        # writer drops sizes bigger than the base image and resamples any size it is not given
+        icon_images = [_logo_variant(w) for w, _ in reversed(icon_sizes)]
 
         # Save as ICO with all sizes
         icon_images[0].save(
             output,
             format="ICO",
             sizes=icon_sizes,
-            quality=95
+            append_images=icon_images[1:]
         )
 
         print(f"✓ Created Windows ICO file: {output}")
@@ -121,7 +164,11 @@ def convert_header_jpg():
         return False
 
     try:
-        img = Image.open(source)
+        with Image.open(source) as img:
+            img.load()  # Decode once before the resize workers share it; the file closes here
+        if img.mode != "RGB":
+            # One conversion up front instead of per variant (PNG cannot store CMYK JPEGs anyway)
+            img = img.convert("RGB")
         original_size = img.size
         print(f"✓ Loaded header: {source} ({original_size})")
 
@@ -136,20 +183,29 @@ def convert_header_jpg():
             "small": 60,      # Small header
         }
 
-        for name, target_height in heights.items():
-            # Calculate width to maintain aspect ratio
-            target_width = int(target_height * aspect_ratio)
-
-            # Resize
-            resized = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
-
-            # Save as PNG (better for transparency/compression)
-            output = Path(f"assets/headers/ayesa_header_{name}_{target_width}x{target_height}.png")
-            resized.save(output, "PNG", quality=95, optimize=True)
-            print(f"  ✓ {name} ({target_width}x{target_height}): {output}")
-
-        # Also keep original as PNG for reference
-        img.save(Path("assets/headers/ayesa_header_original.png"), "PNG", quality=95)
+        # Calculate width to maintain aspect ratio
+        targets = {name: (int(h * aspect_ratio), h) for name, h in heights.items()}
+
+        # Resize and save as PNG (better for transparency/compression), variants in parallel.
+        # Only the small header, where file size matters most, pays for maximum zlib effort.
+        # The full-size reference copy is encoded on the same pool, alongside the variants.
+        with ThreadPoolExecutor(max_workers=min(len(targets) + 1, os.cpu_count() or 1)) as pool:
+            original = pool.submit(
+                img.copy().save, Path("assets/headers/ayesa_header_original.png"), "PNG",
+                compress_level=PNG_COMPRESS_LEVEL
+            )
+            futures = [
+                pool.submit(
+                    _resize_and_save, img, (w, h), Path(f"assets/headers/ayesa_header_{name}_{w}x{h}.png"),
+                    **({"optimize": True} if name == "small" else {"compress_level": PNG_COMPRESS_LEVEL})
+                )
+                for name, (w, h) in targets.items()
+            ]
+            for (name, (w, h)), future in zip(targets.items(), futures, strict=True):
+                print(f"  ✓ {name} ({w}x{h}): {future.result()}")
+
+            # Also keep original as PNG for reference
+            original.result()
         print(f"  ✓ Original (reference): assets/headers/ayesa_header_original.png")
 
         return True
@@ -161,25 +217,22 @@ def convert_header_jpg():
 
 def extract_colors():
     """Extract dominant colors from logo for branding.py."""
-    source = Path(".github/idVZeT5U0c_logos.png")
+    source = SOURCE_LOGO
 
     if not source.exists():
         print(f"✗ Logo not found: {source}")
         return None
 
     try:
-        img = Image.open(source).convert("RGB")
-
-        # Resize to 10x10 for color analysis
-        small_img = img.resize((10, 10), Image.Resampling.LANCZOS)
-
-        # Get all pixels and find most common colors
-        pixels = list(small_img.getdata())
+        img = _load_logo().convert("RGB")
 
-        # Sort by frequency
-        from collections import Counter
-        color_counts = Counter(pixels)
-        most_common = color_counts.most_common(5)
+        # Median-cut the full image down to a 5-color palette, then rank palette entries by pixel count
+        pal_img = img.quantize(colors=5, method=Image.Quantize.MEDIANCUT)
+        palette = pal_img.getpalette()
+        most_common = [
+            (tuple(palette[3 * index:3 * index + 3]), count)
+            for count, index in sorted(pal_img.getcolors(), reverse=True)
+        ]
 
         print("✓ Extracted dominant colors from logo:")
         colors = {}
@@ -270,6 +323,7 @@ def main():
     # Create directories
     print("Step 1: Creating asset directories...")
     ensure_directories()
+    verify_codecs()
     print()
 
     # Convert logo